@@ -0,0 +1,100 @@
+"""A circular list of integers, split into blocks to find and move them quickly."""
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate, chain
+from math import isqrt
+
+
+class BlockList:
+    """A circular list of the integers 0 to size - 1, in blocks of about sqrt(size).
+
+    Each integer's block is recorded, so finding an integer only searches its
+    block, and moving it only shifts the blocks it leaves and joins. The blocks
+    are rebuilt whenever one grows to twice the usual size.
+
+    Moves wrap around the circle modulo size - 1, as the integer being moved is
+    taken out of the circle before counting on, so moving by size - 1 leaves the
+    order unchanged.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create the list, in order.
+
+        Args:
+            size (int): the number of integers
+        """
+        self.size = size
+        self.block_size = max(1, isqrt(size))
+        self._rebuild(range(size))
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterator for the integers, in order.
+
+        Returns:
+            Iterator[int]: the integers
+        """
+        return chain.from_iterable(self.blocks)
+
+    def __len__(self) -> int:
+        """Find the number of integers.
+
+        Returns:
+            int: the number of integers
+        """
+        return self.size
+
+    def index(self, item: int) -> int:
+        """Find the position of an integer.
+
+        Args:
+            item (int): the integer
+
+        Returns:
+            int: its position
+        """
+        block = self.block_of[item]
+        return sum(self.lengths[:block]) + self.blocks[block].index(item)
+
+    def move(self, item: int, offset: int) -> None:
+        """Move an integer around the circle, by taking it out and counting on.
+
+        Args:
+            item (int): the integer to move
+            offset (int): how far to move it, with negative offsets moving back
+        """
+        if self.size <= 1:
+            return
+
+        # take the integer out
+        block = self.block_of[item]
+        position = sum(self.lengths[:block]) + self.blocks[block].index(item)
+        self.blocks[block].remove(item)
+        self.lengths[block] -= 1
+
+        # put it back in the block holding the new position
+        target = (position + offset) % (self.size - 1)
+        ends = list(accumulate(self.lengths))
+        block = bisect_right(ends, target)
+        self.blocks[block].insert(target - ends[block] + self.lengths[block], item)
+        self.lengths[block] += 1
+        self.block_of[item] = block
+
+        if self.lengths[block] > 2 * self.block_size:
+            self._rebuild(list(self))
+
+    def _rebuild(self, items: Iterable[int]) -> None:
+        """Split the integers into evenly sized blocks.
+
+        Args:
+            items (Iterable[int]): the integers, in order
+        """
+        items = list(items)
+        self.blocks = [
+            items[i : i + self.block_size]
+            for i in range(0, len(items), self.block_size)
+        ]
+        self.lengths = [len(block) for block in self.blocks]
+        self.block_of = [0] * len(items)
+        for i, block in enumerate(self.blocks):
+            for item in block:
+                self.block_of[item] = i
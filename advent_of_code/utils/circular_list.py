@@ -0,0 +1,96 @@
+"""A circular linked list of small non-negative integers."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+
+
+class CircularList:
+    """A circular singly linked list, with the values used as their own nodes.
+
+    The successor of each value is held in an array("I") indexed by the value,
+    so the values must be distinct and small enough to index. Moving values
+    around the circle never allocates, and for the tightest loops the
+    successors can be read and written directly.
+    """
+
+    def __init__(self, values: Iterable[int], size: int = 0) -> None:
+        """Link the values into a circle, in the given order.
+
+        Args:
+            values (Iterable[int]): the initial values, in order
+            size (int): room for values up to size - 1, to allow for values
+                inserted later. Defaults to the largest initial value.
+        """
+        initial = list(values)
+        self.successors = array("I", [0]) * max(size, max(initial) + 1)
+        for value, successor in pairwise([*initial, initial[0]]):
+            self.successors[value] = successor
+
+    def after(self, value: int, steps: int = 1) -> int:
+        """Find the value a number of steps clockwise of another.
+
+        Args:
+            value (int): the value to start from
+            steps (int): the number of steps to take. Defaults to 1.
+
+        Returns:
+            int: the value reached
+        """
+        successors = self.successors
+        for _ in range(steps):
+            value = successors[value]
+        return value
+
+    def insert_after(self, value: int, new_value: int) -> None:
+        """Insert a new value into the circle.
+
+        Args:
+            value (int): the value to insert after
+            new_value (int): the value to insert, which must not be in the circle
+        """
+        self.successors[new_value] = self.successors[value]
+        self.successors[value] = new_value
+
+    def remove_after(self, value: int) -> int:
+        """Remove the value following another from the circle.
+
+        Args:
+            value (int): the value before the one to remove
+
+        Returns:
+            int: the value removed
+        """
+        removed = self.successors[value]
+        self.successors[value] = self.successors[removed]
+        return removed
+
+    def move_after(self, value: int, count: int, destination: int) -> None:
+        """Move a run of values to follow another value.
+
+        Args:
+            value (int): the value before the run to move
+            count (int): the number of values in the run
+            destination (int): the value to place the run after, which must not
+                be in the run
+        """
+        first = self.successors[value]
+        last = self.after(value, count)
+        self.successors[value] = self.successors[last]
+        self.successors[last] = self.successors[destination]
+        self.successors[destination] = first
+
+    def values_after(self, value: int) -> Iterator[int]:
+        """Iterator for the values clockwise of a value, all the way around.
+
+        Args:
+            value (int): the value to start after
+
+        Yields:
+            int: the next value, stopping before the start value is reached again
+        """
+        current = self.successors[value]
+        while current != value:
+            yield current
+            current = self.successors[current]
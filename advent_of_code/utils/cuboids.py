@@ -0,0 +1,132 @@
+"""Count the cells left on by switching axis-aligned boxes on and off."""
+from collections.abc import Sequence
+from functools import reduce
+
+import numpy as np
+
+# boxes are held as the inclusive (min, max) range along each axis in turn,
+# flattened into a single tuple, such as (min_x, max_x, min_y, max_y)
+Box = tuple[int, ...]
+
+# the largest coordinate compressed grid to sweep, before switching to counts
+COMPRESSED_LIMIT = 1 << 22
+
+
+def count_switched_on(steps: Sequence[tuple[bool, Box]]) -> int:
+    """Count the cells that are on, after switching each box on or off in turn.
+
+    Small inputs are swept across a coordinate compressed grid, otherwise
+    overlapping boxes are cancelled out with signed counts.
+
+    Args:
+        steps (Sequence[tuple[bool, Box]]): whether to switch on, and the box
+
+    Returns:
+        int: the number of cells switched on
+    """
+    if not steps:
+        return 0
+    if (2 * len(steps)) ** (len(steps[0][1]) // 2) <= COMPRESSED_LIMIT:
+        return _compressed(steps)
+    return _signed_counts(steps)
+
+
+def _compressed(steps: Sequence[tuple[bool, Box]]) -> int:
+    """Sweep the steps across a coordinate compressed grid.
+
+    The last step to cover each compressed cell decides if it is on.
+
+    Args:
+        steps (Sequence[tuple[bool, Box]]): whether to switch on, and the box
+
+    Returns:
+        int: the number of cells switched on
+    """
+    # the edges of the boxes along each axis, with the maximums made exclusive
+    axes = range(len(steps[0][1]) // 2)
+    edges = [
+        sorted(
+            {box[2 * axis] for _, box in steps}
+            | {box[2 * axis + 1] + 1 for _, box in steps}
+        )
+        for axis in axes
+    ]
+    indexes = [{edge: i for i, edge in enumerate(axis_edges)} for axis_edges in edges]
+
+    grid = np.zeros([len(axis_edges) - 1 for axis_edges in edges], dtype=np.bool_)
+    for switch_on, box in steps:
+        grid[
+            tuple(
+                slice(
+                    indexes[axis][box[2 * axis]], indexes[axis][box[2 * axis + 1] + 1]
+                )
+                for axis in axes
+            )
+        ] = switch_on
+
+    # weight each compressed cell by the number of cells it covers
+    sizes = reduce(np.multiply.outer, (np.diff(axis_edges) for axis_edges in edges))
+    return int(sizes[grid].sum())
+
+
+def _signed_counts(steps: Sequence[tuple[bool, Box]]) -> int:
+    """Merge the steps into signed counts of boxes, using inclusion-exclusion.
+
+    Each step cancels its overlap with every counted box, then counts itself
+    if switching on. Overlaps of the same box merge, so cancelling counts drop
+    out of the dictionary rather than growing the work for later steps.
+
+    Args:
+        steps (Sequence[tuple[bool, Box]]): whether to switch on, and the box
+
+    Returns:
+        int: the number of cells switched on
+    """
+    counts: dict[Box, int] = {}
+    for switch_on, box in steps:
+        updates: dict[Box, int] = {box: 1} if switch_on else {}
+        for other, count in counts.items():
+            if overlap := _intersection(box, other):
+                updates[overlap] = updates.get(overlap, 0) - count
+        for overlap, count in updates.items():
+            if total := counts.get(overlap, 0) + count:
+                counts[overlap] = total
+            else:
+                counts.pop(overlap, None)
+
+    return sum(count * _volume(box) for box, count in counts.items())
+
+
+def _intersection(a: Box, b: Box) -> Box:
+    """Find the intersection of two boxes.
+
+    Args:
+        a (Box): the first box
+        b (Box): the second box
+
+    Returns:
+        Box: the intersection, or an empty tuple if the boxes do not overlap
+    """
+    result = []
+    for axis in range(0, len(a), 2):
+        low = max(a[axis], b[axis])
+        high = min(a[axis + 1], b[axis + 1])
+        if low > high:
+            return ()
+        result += [low, high]
+    return tuple(result)
+
+
+def _volume(box: Box) -> int:
+    """Find the number of cells in a box.
+
+    Args:
+        box (Box): the box
+
+    Returns:
+        int: the number of cells
+    """
+    volume = 1
+    for axis in range(0, len(box), 2):
+        volume *= box[axis + 1] - box[axis] + 1
+    return volume
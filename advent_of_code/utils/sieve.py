@@ -0,0 +1,54 @@
+"""Find the first integer avoiding forbidden residues, using a residue sieve."""
+from collections.abc import Iterable, Mapping
+from math import lcm
+
+import numpy as np
+
+# the largest sieve to build by combining moduli, before checking the remaining
+# moduli against windows of candidates
+SIEVE_LIMIT = 1 << 22
+WINDOW_SIZE = 1 << 20
+
+
+def first_admissible(forbidden: Mapping[int, Iterable[int]]) -> int:
+    """Find the smallest non-negative integer that avoids every forbidden residue.
+
+    The admissible residues of each modulus are combined into a boolean sieve
+    over their lowest common multiple, for as long as it stays small. Any
+    remaining moduli are then checked against windows of the admissible
+    candidates, in order.
+
+    Args:
+        forbidden (Mapping[int, Iterable[int]]): the forbidden residues of each
+            modulus
+
+    Returns:
+        int: the smallest admissible integer
+    """
+    # combine the moduli into a sieve, deferring any that would make it too big
+    sieve = np.ones(1, dtype=np.bool_)
+    deferred = []
+    for modulus, residues in sorted(forbidden.items()):
+        admissible = np.ones(modulus, dtype=np.bool_)
+        admissible[list(residues)] = False
+        combined = lcm(len(sieve), modulus)
+        if combined <= SIEVE_LIMIT:
+            sieve = np.tile(sieve, combined // len(sieve)) & np.tile(
+                admissible, combined // modulus
+            )
+        else:
+            deferred.append((modulus, admissible))
+
+    # check the admissible candidates against the deferred moduli, a window at a
+    # time, with each window in ascending order
+    candidates = np.flatnonzero(sieve)
+    rows = np.arange(max(1, WINDOW_SIZE // len(candidates)))[:, None]
+    start = 0
+    while True:
+        window = (start + len(sieve) * rows + candidates).ravel()
+        passes = np.ones(len(window), dtype=np.bool_)
+        for modulus, admissible in deferred:
+            passes &= admissible[window % modulus]
+        if passes.any():
+            return int(window[passes.argmax()])
+        start += len(sieve) * len(rows)
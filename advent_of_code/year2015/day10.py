@@ -5,7 +5,8 @@ Elves Look, Elves Say
 For puzzle specification and desciption, visit
 https://adventofcode.com/2015/day/10
 """
-from itertools import groupby
+from collections import Counter
+from itertools import groupby, islice
 from pathlib import Path
 from sys import path
 
@@ -41,7 +42,7 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return len(self._run(self.puzzle_input, 40))
+        return self._run(self.puzzle_input, 40)
 
     @cache_result
     def solve_part_two(self) -> int:
@@ -50,21 +51,115 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return len(self._run(self._run(self.puzzle_input, 40), 10))
+        return self._run(self.puzzle_input, 50)
 
-    def _run(self, seq: str, cycles: int) -> str:
-        """Run the solution.
+    def _run(self, seq: str, cycles: int) -> int:
+        """Run the solution, counting the elements of the sequence.
+
+        The sequence is split into Conway's elements, substrings that never
+        interact with their neighbours, so only the count of each element needs
+        to be kept. A sequence that cannot be split is simply one large element.
 
         Args:
             seq (str): input sequence
             cycles (int): number of cycles to complete
 
+        Returns:
+            int: the length of the output sequence
+        """
+        # only split the sequence once it is two cycles old, as in Conway's
+        # Splitting Theorem
+        for _ in range(min(cycles, 2)):
+            seq = self._look_and_say(seq)
+        elements = Counter(self._split(seq))
+        decays: dict[str, list[str]] = {}
+        for _ in range(cycles - 2):
+            next_elements: Counter[str] = Counter()
+            for element, count in elements.items():
+                if element not in decays:
+                    decays[element] = self._split(self._look_and_say(element))
+                for decayed in decays[element]:
+                    next_elements[decayed] += count
+            elements = next_elements
+
+        return sum(len(element) * count for element, count in elements.items())
+
+    def _look_and_say(self, seq: str) -> str:
+        """Look and say a sequence once.
+
+        Args:
+            seq (str): the sequence
+
         Returns:
             str: the output sequence
         """
-        for _ in range(cycles):
-            seq = "".join(str(len(list(g))) + k for k, g in groupby(seq))
-        return seq
+        return "".join(f"{len(list(g))}{k}" for k, g in groupby(seq))
+
+    def _split(self, seq: str) -> list[str]:
+        """Split a sequence into elements.
+
+        Args:
+            seq (str): the sequence
+
+        Returns:
+            list[str]: the elements
+        """
+        result = []
+        start = 0
+        for i in range(1, len(seq)):
+            if seq[i] != seq[i - 1] and self._splits(seq[i - 1], seq[i:]):
+                result.append(seq[start:i])
+                start = i
+        result.append(seq[start:])
+        return result
+
+    def _splits(self, digit: str, right: str) -> bool:
+        """Check a two cycle old sequence splits, using Conway's Splitting Theorem.
+
+        The sequence splits after a digit n >= 4 when the right side starts with a
+        digit up to 3. After a 2, the right side must start as described in
+        _follows_two, and after any other digit it must be 22, or start with 22
+        followed by the same.
+
+        Args:
+            digit (str): the last digit of the left side
+            right (str): the right side
+
+        Returns:
+            bool: True if the sequence splits
+        """
+        runs = [(k, len(list(g))) for k, g in islice(groupby(right), 4)]
+        return (
+            (digit >= "4" and right[0] <= "3")
+            or (digit == "2" and self._follows_two(runs))
+            or (
+                digit in "13"
+                and runs[0] == ("2", 2)
+                and (len(runs) == 1 or self._follows_two(runs[1:]))
+            )
+        )
+
+    def _follows_two(self, runs: list[tuple[str, int]]) -> bool:
+        """Check the runs can start the right side of a split after a 2.
+
+        They must start 1X (with a single X), 111, 3X (with X not repeated three
+        times) or a single digit n >= 4.
+
+        Args:
+            runs (list[tuple[str, int]]): the first runs of the right side, as the
+                digit and its length
+
+        Returns:
+            bool: True if the runs can follow a 2
+        """
+        first, length = runs[0]
+        following = runs[1][1] if len(runs) > 1 else 0
+        return (
+            (first == "1" and length == 1 and following == 1)
+            or (first == "1" and length == 3)
+            or (first == "3" and length == 1 and following != 3)
+            or (first >= "4" and length == 1)
+        )
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,9 +5,10 @@ Wizard Simulator 20XX
 For puzzle specification and desciption, visit
 https://adventofcode.com/2015/day/22
 """
-from enum import Enum, auto, unique
+from collections.abc import Iterator, Sequence
+from heapq import heappop, heappush
 from pathlib import Path
-from sys import maxsize, path
+from sys import path
 
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
@@ -17,210 +18,18 @@ from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_decorators import cache_result
 from advent_of_code.utils.solver_interface import SolverInterface
 
-
-@unique
-class Spells(Enum):
-    """Represents all the spell moves."""
-
-    MAGIC_MISSILE = auto()
-    DRAIN = auto()
-    SHIELD = auto()
-    POISON = auto()
-    RECHARGE = auto()
-
-
-spell_costs = {
-    Spells.MAGIC_MISSILE: 53,
-    Spells.DRAIN: 73,
-    Spells.SHIELD: 113,
-    Spells.POISON: 173,
-    Spells.RECHARGE: 229,
-}
-
-spell_duration = {Spells.SHIELD: 6, Spells.POISON: 6, Spells.RECHARGE: 5}
-
-
-@unique
-class Turn(Enum):
-    """Who's turn is it anyway?."""
-
-    PLAYER = auto()
-    BOSS = auto()
-
-
-class MinimumValue:
-    """Keep track of the minimum of all the values passed through update."""
-
-    value: int
-
-    def __init__(self) -> None:
-        """Initialise to the largest possible value."""
-        self.value = maxsize
-
-    def update(self, value: int) -> None:
-        """Update value, only storing if it is the new minimum.
-
-        Args:
-            value (int): The next value
-        """
-        if value < self.value:
-            self.value = value
-
-
-class Game:
-    """The Game simulation, in which a player battles a boss."""
-
-    def __init__(
-        self, player_hp: int, cash: int, boss_hp: int, boss_damage: int, hard_mode: bool
-    ) -> None:
-        """Store the inital settings.
-
-        Args:
-            player_hp (int): Players' health points (HP)
-            cash (int): the starting cash
-            boss_hp (int): the boss' health points (HP)
-            boss_damage (int): the boss's starting damage
-            hard_mode (bool): True for hard, False for easy
-
-        """
-        self.initial_player_hp = player_hp
-        self.initial_cash = cash
-        self.initial_boss_hp = boss_hp
-        self.initial_hard_mode = hard_mode
-        self.initial_boss_damage = boss_damage
-
-    def battle(self) -> int:
-        """Start the battle.
-
-        Returns:
-            int: the the least spent to win
-        """
-        self.player_hp = self.initial_player_hp
-        self.cash = self.initial_cash
-        self.boss_hp = self.initial_boss_hp
-        self.hard_mode = self.initial_hard_mode
-        self.boss_damage = self.initial_boss_damage
-        self.spent = 0
-        self.armor = 0
-        self.depth = 0
-        self.effects: dict[Spells, int] = {}
-
-        # This is a reference to the min value, rather than storing directly
-        # as an int, so that it is common to all sub games
-        self.best_so_far = MinimumValue()
-
-        self.turn = Turn.PLAYER
-        return self.next_turn()
-
-    def next_turn(self) -> int:
-        """Take the turn.
-
-        Returns:
-            int: result fo this turn
-        """
-        # have we already found a better result?
-        if self.best_so_far.value <= self.spent:
-            return maxsize
-
-        # apply effects
-        self.armor = 0
-        for x in self.effects:
-            if x == Spells.SHIELD:
-                self.armor = 7
-            if x == Spells.POISON:
-                self.boss_hp -= 3
-            if x == Spells.RECHARGE:
-                self.cash += 101
-        # reduce effect count by one, and remove if becomes zero
-        self.effects = {x: (t - 1) for x, t in self.effects.items() if t > 1}
-
-        # check if the boss is dead from the poison
-        if self.boss_hp <= 0:
-            self.best_so_far.update(self.spent)
-            return self.spent
-
-        # take the turn
-        if self.turn == Turn.PLAYER:
-            return self.player_turn()
-        return self.boss_turn()
-
-    def player_turn(self) -> int:
-        """Player's turn to attack.
-
-        Returns:
-            int: the lowest cash spent
-        """
-        if self.hard_mode:
-            self.player_hp -= 1
-            if self.player_hp <= 0:
-                return maxsize
-
-        # work out the valid move set
-        moves = [
-            spell
-            for spell, cost in spell_costs.items()
-            if (cost <= self.cash) and (spell not in self.effects)
-        ]
-
-        # no valid moves
-        if len(moves) == 0:
-            return maxsize
-
-        # take each move in turn, to find the best next move
-        least_spent = maxsize
-        for move in moves:
-            child = self.spawn_child()
-            child.cash -= spell_costs[move]
-            child.spent += spell_costs[move]
-            if move == Spells.MAGIC_MISSILE:
-                child.boss_hp -= 4
-            elif move == Spells.DRAIN:
-                child.boss_hp -= 2
-                child.player_hp += 2
-            elif move in spell_duration:
-                child.effects[move] = spell_duration[move]
-
-            if child.boss_hp <= 0:
-                least_spent = min(least_spent, child.spent)
-            else:
-                child.depth += 1
-                child.turn = Turn.BOSS
-                least_spent = min(least_spent, child.next_turn())
-        self.best_so_far.update(least_spent)
-        return least_spent
-
-    def boss_turn(self) -> int:
-        """Boss's turn to attack.
-
-        Returns:
-            int: the lowest cash spent
-        """
-        self.player_hp -= max(1, self.boss_damage - self.armor)
-        if self.player_hp <= 0:
-            return maxsize
-        self.depth += 1
-        self.turn = Turn.PLAYER
-        return self.next_turn()
-
-    def spawn_child(self) -> "Game":
-        """Make a copy of the game.
-
-        Returns:
-            "Game": Return a copy of self
-        """
-        obj = type(self).__new__(self.__class__)
-        obj.player_hp = self.player_hp
-        obj.cash = self.cash
-        obj.armor = self.armor
-        obj.spent = self.spent
-        obj.effects = self.effects.copy()
-        obj.boss_hp = self.boss_hp
-        obj.depth = self.depth
-        obj.hard_mode = self.hard_mode
-        obj.boss_damage = self.boss_damage
-        obj.best_so_far = self.best_so_far
-
-        return obj
+# the spells, as their cost, instant damage, instant healing, and the effect
+# timer they start with its duration
+SPELLS = (
+    (53, 4, 0, None, 0),  # magic missile
+    (73, 2, 2, None, 0),  # drain
+    (113, 0, 0, 0, 6),  # shield
+    (173, 0, 0, 1, 6),  # poison
+    (229, 0, 0, 2, 5),  # recharge
+)
+SHIELD_ARMOR = 7
+POISON_DAMAGE = 3
+RECHARGE_MANA = 101
 
 
 class Solver(SolverInterface):
@@ -256,13 +65,7 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return Game(
-            player_hp=50,
-            cash=500,
-            boss_hp=self.boss_hp,
-            boss_damage=self.boss_damage,
-            hard_mode=False,
-        ).battle()
+        return self._battle(hard_mode=False)
 
     @cache_result
     def solve_part_two(self) -> int:
@@ -271,13 +74,114 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return Game(
-            player_hp=50,
-            cash=500,
-            boss_hp=self.boss_hp,
-            boss_damage=self.boss_damage,
-            hard_mode=True,
-        ).battle()
+        return self._battle(hard_mode=True)
+
+    def _battle(self, hard_mode: bool) -> int:
+        """Find the least mana to spend and still win, using Dijkstra's Algorithm.
+
+        Each state is an immutable tuple of the mana spent, the player's hit
+        points and mana, the boss's hit points and the shield, poison and
+        recharge timers, at the start of the player's turn. A state is dropped
+        if one with the same boss hit points and timers has already been reached
+        for no more mana spent, with at least as many hit points and as much mana.
+
+        Args:
+            hard_mode (bool): True for hard, False for easy
+
+        Returns:
+            int: the least mana spent to win
+        """
+        queue = [(0, 50, 500, self.boss_hp, (0, 0, 0))]
+        visited: dict[tuple[int, tuple[int, int, int]], list[tuple[int, int]]] = {}
+
+        result = -1
+        while queue:
+            spent, player_hp, mana, boss_hp, timers = heappop(queue)
+            if boss_hp <= 0:
+                result = spent
+                break
+
+            # the player's turn
+            if hard_mode:
+                player_hp -= 1
+                if player_hp <= 0:
+                    continue
+            boss_hp, mana, _, timers = self._apply_effects(boss_hp, mana, timers)
+            if boss_hp <= 0:
+                # defeated by poison, so no spell is needed
+                heappush(queue, (spent, player_hp, mana, boss_hp, timers))
+                continue
+            seen = visited.setdefault((boss_hp, timers), [])
+            if any(hp >= player_hp and m >= mana for hp, m in seen):
+                continue
+            seen.append((player_hp, mana))
+
+            for next_state in self._cast_spells(
+                spent, player_hp, mana, boss_hp, timers
+            ):
+                heappush(queue, next_state)
+
+        return result
+
+    def _cast_spells(
+        self,
+        spent: int,
+        player_hp: int,
+        mana: int,
+        boss_hp: int,
+        timers: tuple[int, int, int],
+    ) -> Iterator[tuple[int, int, int, int, tuple[int, int, int]]]:
+        """Iterator for casting each spell, then taking the boss's turn.
+
+        Args:
+            spent (int): the mana spent so far
+            player_hp (int): the player's hit points
+            mana (int): the player's mana
+            boss_hp (int): the boss's hit points
+            timers (tuple[int, int, int]): the shield, poison and recharge timers
+
+        Yields:
+            tuple[int, int, int, int, tuple[int, int, int]]: the next state,
+                unless the player has been defeated
+        """
+        for cost, damage, healing, effect, duration in SPELLS:
+            if cost > mana or (effect is not None and timers[effect]):
+                continue
+            started = list(timers)
+            if effect is not None:
+                started[effect] = duration
+
+            # the boss attacks, unless already defeated
+            next_boss_hp, next_mana, armor, next_timers = self._apply_effects(
+                boss_hp - damage, mana - cost, started
+            )
+            next_player_hp = player_hp + healing
+            if next_boss_hp > 0:
+                next_player_hp -= max(1, self.boss_damage - armor)
+            if next_player_hp > 0:
+                yield spent + cost, next_player_hp, next_mana, next_boss_hp, next_timers
+
+    def _apply_effects(
+        self, boss_hp: int, mana: int, timers: Sequence[int]
+    ) -> tuple[int, int, int, tuple[int, int, int]]:
+        """Apply the active effects at the start of a turn.
+
+        Args:
+            boss_hp (int): the boss's hit points
+            mana (int): the player's mana
+            timers (Sequence[int]): the shield, poison and recharge timers
+
+        Returns:
+            tuple[int, int, int, tuple[int, int, int]]: the boss's hit points, the
+                player's mana and armor, and the updated timers
+        """
+        shield, poison, recharge = timers
+        return (
+            boss_hp - POISON_DAMAGE * (poison > 0),
+            mana + RECHARGE_MANA * (recharge > 0),
+            SHIELD_ARMOR * (shield > 0),
+            (max(0, shield - 1), max(0, poison - 1), max(0, recharge - 1)),
+        )
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,11 +5,8 @@ Radioisotope Thermoelectric Generators
 For puzzle specification and desciption, visit
 https://adventofcode.com/2016/day/11
 """
-from __future__ import annotations
-
-from abc import ABC, abstractmethod
-from collections import defaultdict, deque
 from collections.abc import Iterator
+from heapq import heappop, heappush
 from itertools import combinations
 from pathlib import Path
 from re import findall
@@ -22,133 +19,48 @@ from advent_of_code.utils.parser import parse_lines
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
-
-class Item(ABC):
-    """Class to represent an item on the floor."""
-
-    def __init__(self, material: str) -> None:
-        """Initialises the item.
-
-        Args:
-            material (str): The material of the item
-        """
-        self.material = material
-
-    @abstractmethod
-    def safe(self, others: list[Item]) -> bool:
-        """Determines if this is safe to store with other Items.
-
-        Args:
-            others (list[Item]): The other items
-
-        Returns:
-            bool: True if safe, otherwise False
-        """
-
-
-class GeneratorItem(Item):
-    """The generator item."""
-
-    def safe(self, _: list[Item]) -> bool:
-        """Determines if this is safe to store with other Items.
-
-        Args:
-            _ (list[Item]): The other items
-
-        Returns:
-            bool: True if safe, otherwise False
-        """
-        return True
-
-    def __repr__(self) -> str:
-        """The string representation of this object.
-
-        Returns:
-            str: The string representation of this object.
-        """
-        return f"{self.material} generator"  # pragma: no cover
-
-
-class Microchip(Item):
-    """A Microchip item."""
-
-    def safe(self, others: list[Item]) -> bool:
-        """Determines if this is safe to store with other Items.
-
-        Args:
-            others (list[Item]): The other items
-
-        Returns:
-            bool: True if safe, otherwise False
-        """
-        return any(
-            isinstance(x, GeneratorItem) and self.material == x.material for x in others
-        ) or all(isinstance(x, Microchip) for x in others)
-
-    def __repr__(self) -> str:
-        """The string representation of this object.
-
-        Returns:
-            str: The string representation of this object.
-        """
-        return f"{self.material}-compatible microchip"  # pragma: no cover
-
-
-class State:
-    """Represents a complete state in the simulation."""
-
-    def __init__(self, elevator: int, floors: list[list[Item]], step: int) -> None:
-        """Initialise the state.
-
-        Args:
-            elevator (int): the location of the elevator
-            floors (list[list[Item]]): the floors in the state
-            step (int): the number of steps away from the start
-        """
-        self.elevator = elevator
-        self.floors = floors
-        self.step = step
-
-    def next_state(self) -> Iterator[State]:
-        """Iterator for all the safe moves from here.
-
-        Yields:
-            State: the next safe state
-        """
-        for items_in_elevator in [2, 1]:
-            for items in combinations(self.floors[self.elevator], items_in_elevator):
-                for move in [1, -1]:
-                    new_elevator = self.elevator + move
-                    if new_elevator in range(len(self.floors)):
-                        # move the items to the new floor
-                        new_floors = [
-                            [x for x in floor if x not in items]
-                            for floor in self.floors
-                        ]
-                        new_floors[new_elevator] += items
-
-                        if all(
-                            y.safe(new_floors[i])
-                            for i, x in enumerate(new_floors)
-                            for y in x
-                        ):
-                            yield State(new_elevator, new_floors, self.step + 1)
-
-    def equivalence(self) -> tuple[int, tuple[tuple[int, ...], ...]]:
-        """Create a comparator of states, focusing on pairs rather than names.
-
-        Returns:
-            tuple[int, tuple[tuple[int, ...], ...]]: the formatted output
-        """
-        mapper: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0])
-        for i, floor in enumerate(self.floors):
-            for item in floor:
-                if isinstance(item, Microchip):
-                    mapper[item.material][0] = i
-                else:
-                    mapper[item.material][1] = i
-        tuples = tuple(sorted([tuple(x) for x in mapper.values()]))
-        return (self.elevator, tuples)
+# The state is packed into an int. The lowest two bits hold the elevator floor,
+# followed by a four bit count for each (microchip floor, generator floor) pair,
+# which makes states that differ only by material names identical.
+FLOORS = 4
+ELEVATOR_MASK = 0b11
+FIELD_BITS = 4
+FIELD_MASK = 0b1111
+
+
+def _offset(chip: int, generator: int) -> int:
+    """Find the bit offset of the count of a pair in the packed state.
+
+    Args:
+        chip (int): the floor of the microchip
+        generator (int): the floor of the generator
+
+    Returns:
+        int: the offset
+    """
+    return 2 + FIELD_BITS * (chip * FLOORS + generator)
+
+
+PAIRS = [(chip, generator) for chip in range(FLOORS) for generator in range(FLOORS)]
+
+# for each floor, the fields holding microchips without their generator, and the
+# fields holding generators, which must not both be present for a floor to be safe
+LONE_CHIP_MASKS = [
+    sum(
+        FIELD_MASK << _offset(chip, generator)
+        for chip, generator in PAIRS
+        if chip == floor != generator
+    )
+    for floor in range(FLOORS)
+]
+GENERATOR_MASKS = [
+    sum(
+        FIELD_MASK << _offset(chip, generator)
+        for chip, generator in PAIRS
+        if generator == floor
+    )
+    for floor in range(FLOORS)
+]
 
 
 class Solver(SolverInterface):
@@ -164,7 +76,6 @@ class Solver(SolverInterface):
         Args:
             puzzle_input (list[str]): The lines of the input file
         """
-        item_initializers = {"generator": GeneratorItem, "microchip": Microchip}
         floors = parse_lines(
             puzzle_input,
             (
@@ -172,18 +83,28 @@ class Solver(SolverInterface):
                 r"(?P<contents>((a|and a) \w+(-compatible)? "
                 r"(generator|microchip)[,. ]*)+"
                 r"|nothing relevant.)",
-                lambda m: [
-                    item_initializers[what](material)
-                    for material, what in findall(
-                        r"(?P<material>\w+)(?:-compatible)? "
-                        r"(?P<what>generator|microchip)",
-                        m["contents"],
-                    )
-                ],
+                lambda m: findall(
+                    r"(?P<material>\w+)(?:-compatible)? "
+                    r"(?P<what>generator|microchip)",
+                    m["contents"],
+                ),
             ),
+            min_length=FLOORS,
+            max_length=FLOORS,
         )
-
-        self.start_state = State(0, floors, 0)
+        chips = {
+            material: i
+            for i, floor in enumerate(floors)
+            for material, what in floor
+            if what == "microchip"
+        }
+        generators = {
+            material: i
+            for i, floor in enumerate(floors)
+            for material, what in floor
+            if what == "generator"
+        }
+        self.pairs = [(chips[material], generators[material]) for material in chips]
 
     def solve_part_one(self) -> int:
         """Solve part one of the puzzle.
@@ -191,7 +112,7 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return self._run(self.start_state)
+        return self._run(self.pairs)
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
@@ -199,48 +120,140 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        floors = self.start_state.floors
-        floors[0] += [
-            GeneratorItem("elerium"),
-            Microchip("elerium"),
-            GeneratorItem("dilithium"),
-            Microchip("dilithium"),
-        ]
-
-        return self._run(State(0, floors, 0))
+        # add the elerium and dilithium pairs to the first floor
+        return self._run([*self.pairs, (0, 0), (0, 0)])
 
-    def _run(self, initial_state: State) -> int:
-        """Run the simulation, using a Breadth First Search Algorithm.
+    def _run(self, pairs: list[tuple[int, int]]) -> int:
+        """Run the simulation, using the A* search algorithm.
 
         Args:
-            initial_state (State): Initial state
+            pairs (list[tuple[int, int]]): the microchip and generator floors
 
         Returns:
             int: the number of steps required to move all items.
         """
-        # setup the queue and the visited set
-        queue: deque[State] = deque()
-        queue.append(initial_state)
-        visited = {initial_state.equivalence()}
+        initial = sum(1 << _offset(chip, generator) for chip, generator in pairs)
+        target = len(pairs) << _offset(FLOORS - 1, FLOORS - 1) | (FLOORS - 1)
+
+        queue = [(self._lower_bound(initial), 0, initial)]
+        visited = {initial: 0}
 
         result = -1
-        while queue and result == -1:
-            state = queue.popleft()
-            for next_state in state.next_state():
-                if all(
-                    len(next_state.floors[i]) == 0
-                    for i in range(len(next_state.floors) - 1)
-                ):
-                    # all items on top floor
-                    result = next_state.step
-                    break
-
-                equivalence = next_state.equivalence()
-                if equivalence not in visited:
-                    visited.add(equivalence)
-                    queue.append(next_state)
+        while queue:
+            _, steps, state = heappop(queue)
+            if state == target:
+                result = steps
+                break
+            for next_state in self._next_states(state):
+                if next_state not in visited or steps + 1 < visited[next_state]:
+                    visited[next_state] = steps + 1
+                    heappush(
+                        queue,
+                        (
+                            steps + 1 + self._lower_bound(next_state),
+                            steps + 1,
+                            next_state,
+                        ),
+                    )
+
         return result
 
+    def _next_states(self, state: int) -> Iterator[int]:
+        """Iterator for all the safe moves from the state.
+
+        Args:
+            state (int): the packed state
+
+        Yields:
+            int: the next safe state
+        """
+        elevator = state & ELEVATOR_MASK
+
+        # find the items on the elevator floor, as the pair type and its count,
+        # with flags to show if the chip or generator moves
+        items = []
+        pairs = []
+        for chip, generator in PAIRS:
+            count = (state >> _offset(chip, generator)) & FIELD_MASK
+            if count and chip == elevator:
+                items += [(chip, generator, count, 1, 0)] * min(count, 2)
+            if count and generator == elevator:
+                items += [(chip, generator, count, 0, 1)] * min(count, 2)
+            if count and chip == generator == elevator:
+                pairs.append((chip, generator, count, 1, 1))
+
+        # load the elevator with one or two items, taking care not to take
+        # two items from a lone pair
+        loads = [
+            *((x, y) for x, y in combinations(items, 2) if x[:2] != y[:2] or x[2] > 1),
+            *((x,) for x in pairs),
+            *((x,) for x in items),
+        ]
+
+        seen = set()
+        for direction in (1, -1):
+            floor = elevator + direction
+            if not 0 <= floor < FLOORS:
+                continue
+            for load in loads:
+                next_state = state - elevator + floor
+                for chip, generator, _, chip_moves, generator_moves in load:
+                    next_state += (
+                        1
+                        << _offset(
+                            chip + chip_moves * direction,
+                            generator + generator_moves * direction,
+                        )
+                    ) - (1 << _offset(chip, generator))
+                if next_state not in seen and self._safe(next_state, elevator, floor):
+                    seen.add(next_state)
+                    yield next_state
+
+    def _safe(self, state: int, *floors: int) -> bool:
+        """Check that no microchip will be fried on the given floors.
+
+        Args:
+            state (int): the packed state
+            *floors (int): the floors to check
+
+        Returns:
+            bool: True if safe, otherwise False
+        """
+        return not any(
+            state & LONE_CHIP_MASKS[floor] and state & GENERATOR_MASKS[floor]
+            for floor in floors
+        )
+
+    def _lower_bound(self, state: int) -> int:
+        """Find a lower bound on the number of steps, for the A* search algorithm.
+
+        Moving items across the boundary above a floor takes two items up and one
+        back down for each round trip, so n items below take at least 2n - 3
+        crossings, or 2n if the elevator has to come back down for them first.
+
+        Args:
+            state (int): the packed state
+
+        Returns:
+            int: the lower bound
+        """
+        elevator = state & ELEVATOR_MASK
+        on_floor = [0] * FLOORS
+        for chip, generator in PAIRS:
+            if count := (state >> _offset(chip, generator)) & FIELD_MASK:
+                on_floor[chip] += count
+                on_floor[generator] += count
+
+        bound = 0
+        items = 0
+        for floor in range(FLOORS - 1):
+            items += on_floor[floor]
+            if items and elevator <= floor:
+                bound += max(1, 2 * items - 3)
+            elif items:
+                bound += 2 * items
+        return bound
+
 
 if __name__ == "__main__":  # pragma: no cover
     runner(Solver)
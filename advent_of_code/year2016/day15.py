@@ -5,6 +5,7 @@ Timing is Everything
 For puzzle specification and desciption, visit
 https://adventofcode.com/2016/day/15
 """
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from sys import path
@@ -14,6 +15,7 @@ if __name__ == "__main__":  # pragma: no cover
 
 from advent_of_code.utils.parser import dataclass_processor, parse_lines
 from advent_of_code.utils.runner import runner
+from advent_of_code.utils.sieve import first_admissible
 from advent_of_code.utils.solver_interface import SolverInterface
 
 
@@ -72,16 +74,14 @@ class Solver(SolverInterface):
         Returns:
             int: the result
         """
-        time = 0
-        while any(
-            (
-                ((disc.start + time + t + 1) % disc.positions) != 0
-                for t, disc in enumerate(discs)
-            )
-        ):
-            time += 1
-
-        return time
+        # forbid every time except the one that lines up each disc's slot
+        forbidden: defaultdict[int, set[int]] = defaultdict(set)
+        for t, disc in enumerate(discs):
+            forbidden[disc.positions] |= set(range(disc.positions)) - {
+                -(disc.start + t + 1) % disc.positions
+            }
+
+        return first_admissible(forbidden)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,6 +5,7 @@
 For puzzle specification and desciption, visit
 https://adventofcode.com/2016/day/16
 """
+from itertools import pairwise
 from pathlib import Path
 from sys import path
 
@@ -48,23 +49,55 @@ class Solver(SolverInterface):
         return self._checksum(35651584)
 
     def _checksum(self, length: int) -> str:
-        # pad data to the correct length
-        data = self.input
-        while len(data) < length:
-            data = "".join(
-                [data, "0", "".join("1" if x == "0" else "0" for x in reversed(data))]
-            )
-        data = data[:length]
-
-        # calculate the checksum
-        checksum = list(data)
-        while len(checksum) % 2 == 0:
-            checksum = [
-                "1" if x == y else "0" for x, y in zip(checksum[::2], checksum[1::2])
-            ]
-
-        # done
-        return "".join(checksum)
+        """Calculate the checksum, without creating the data to fill the disk.
+
+        Folding the data in pairs until the length is odd makes each checksum
+        digit a 1 when a chunk of the data, the largest power of two that divides
+        the length, holds an even number of 1s. These are found by counting the
+        1s before each chunk from the structure of the dragon curve.
+
+        Args:
+            length (int): the length of the disk to fill
+
+        Returns:
+            str: the checksum
+        """
+        chunk = length & -length
+        counts = [self._count_ones(end) for end in range(0, length + 1, chunk)]
+        return "".join(
+            "1" if (after - before) % 2 == 0 else "0"
+            for before, after in pairwise(counts)
+        )
+
+    def _count_ones(self, length: int) -> int:
+        """Count the 1s in the data, up to the length.
+
+        The data is a sequence of blocks, alternating between the input and its
+        reversed complement, each followed by a joiner bit from the dragon curve.
+
+        Args:
+            length (int): the length of data to count
+
+        Returns:
+            int: the number of 1s
+        """
+        seed = self.input
+        reverse_complement = "".join("1" if x == "0" else "0" for x in reversed(seed))
+        blocks, remainder = divmod(length, len(seed) + 1)
+
+        # count the 1s in the complete blocks and their joiners
+        ones = ((blocks + 1) // 2) * seed.count("1")
+        ones += (blocks // 2) * reverse_complement.count("1")
+        joiners = blocks
+        while joiners:
+            # joiner n is 1 when the odd part of n is 3 mod 4, so count the odd
+            # joiners that are 3 mod 4, then the even ones by halving
+            ones += (joiners + 1) // 4
+            joiners //= 2
+
+        # count the 1s in the partial block
+        partial = seed if blocks % 2 == 0 else reverse_complement
+        return ones + partial[:remainder].count("1")
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -50,22 +50,25 @@ class Solver(SolverInterface):
     def _run(self, rows: int) -> int:
         """Run the simulation.
 
-        Mapping the "^" to True, the 4 rules reduce reduce to left != right
+        Each row is held as the bits of an int, with bits set for traps. The 4
+        rules reduce to left != right, so each row is found from the last in one
+        step, as the left and right neighbours xor'ed together.
 
         Args:
             rows (int): the number of rows
 
         Returns:
-            int: the total number of safe / "." / False
+            int: the total number of safe / "." tiles
         """
+        width = len(self.input)
+        mask = (1 << width) - 1
+        row = int(self.input.replace(".", "0").replace("^", "1"), 2)
+
         traps = 0
-        row = [x == "^" for x in self.input]
         for _ in range(rows):
-            traps += row.count(True)
-            row = [
-                left != right for left, right in zip([False, *row], row[1:] + [False])
-            ]
-        return (len(row) * rows) - traps
+            traps += row.bit_count()
+            row = ((row << 1) ^ (row >> 1)) & mask
+        return width * rows - traps
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,7 +5,7 @@ Packet Scanners
 For puzzle specification and desciption, visit
 https://adventofcode.com/2017/day/13
 """
-from itertools import count
+from collections import defaultdict
 from pathlib import Path
 from sys import path
 
@@ -14,6 +14,7 @@ if __name__ == "__main__":  # pragma: no cover
 
 from advent_of_code.utils.parser import parse_lines
 from advent_of_code.utils.runner import runner
+from advent_of_code.utils.sieve import first_admissible
 from advent_of_code.utils.solver_interface import SolverInterface
 
 
@@ -58,14 +59,13 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return next(
-            delay
-            for delay in count()
-            if not any(
-                (delay + depth) % (2 * (length - 1)) == 0
-                for depth, length in self.input.items()
-            )
-        )
+        # forbid the delays that would be caught, grouped by scanner period
+        forbidden: defaultdict[int, set[int]] = defaultdict(set)
+        for depth, length in self.input.items():
+            period = 2 * (length - 1)
+            forbidden[period].add(-depth % period)
+
+        return first_admissible(forbidden)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,10 +5,12 @@ Dueling Generators
 For puzzle specification and desciption, visit
 https://adventofcode.com/2017/day/15
 """
-from collections.abc import Iterator
 from pathlib import Path
 from sys import path
 
+import numpy as np
+from numpy.typing import NDArray
+
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
@@ -16,6 +18,11 @@ from advent_of_code.utils.parser import int_processor_group, parse_lines
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
+FACTOR_A = 16807
+FACTOR_B = 48271
+MODULUS = 2147483647
+BLOCK_SIZE = 1 << 20
+
 
 class Solver(SolverInterface):
     """Solves the puzzle."""
@@ -40,13 +47,7 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        iter_a = self._generator(self.seed_a, 16807)
-        iter_b = self._generator(self.seed_b, 48271)
-        return sum(
-            1
-            for _ in range(40000000)
-            if (next(iter_a) & 65535) == (next(iter_b) & 65535)
-        )
+        return self._judge(40000000, 1, 1)
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
@@ -54,35 +55,65 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        iter_a = self._generator(self.seed_a, 16807, 4)
-        iter_b = self._generator(self.seed_b, 48271, 8)
-        return sum(
-            1
-            for _ in range(5000000)
-            if (next(iter_a) & 65535) == (next(iter_b) & 65535)
-        )
+        return self._judge(5000000, 4, 8)
+
+    def _judge(self, pairs: int, multiple_a: int, multiple_b: int) -> int:
+        """Count the pairs where the lowest 16 bits of both generators match.
+
+        Args:
+            pairs (int): the number of pairs to judge
+            multiple_a (int): only consider multiples of this power of 2 from A
+            multiple_b (int): only consider multiples of this power of 2 from B
+
+        Returns:
+            int: the number of matching pairs
+        """
+        values_a = self._generator(self.seed_a, FACTOR_A, multiple_a, pairs)
+        values_b = self._generator(self.seed_b, FACTOR_B, multiple_b, pairs)
+        return int(np.count_nonzero(values_a == values_b))
+
+    def _generator(
+        self, seed: int, factor: int, multiple: int, count: int
+    ) -> NDArray[np.uint16]:
+        """Simulate the Generator in the puzzle, one block of values at a time.
 
-    def _generator(self, seed: int, factor: int, modulo: int = 1) -> Iterator[int]:
-        """Simulate the Generator in the puzzle.
+        The multipliers factor^1 to factor^BLOCK_SIZE are calculated once, so each
+        block is a single vector multiply of the value before the block, and the
+        value before the next block jumps ahead by factor^BLOCK_SIZE.
 
         Args:
             seed (int): starting value
             factor (int): multiplier factor
-            modulo (int): Only return results multiples of modulo. Defaults to 1.
+            multiple (int): only return values that are multiples of this power of 2
+            count (int): the number of values to return
 
-        Yields:
-            int: the next number in the sequence
+        Returns:
+            NDArray[np.uint16]: the lowest 16 bits of the values
         """
+        multipliers = np.array([factor], dtype=np.uint64)
+        while len(multipliers) < BLOCK_SIZE:
+            multipliers = np.concatenate(
+                (multipliers, multipliers * multipliers[-1] % MODULUS)
+            )
+        jump = int(multipliers[-1])
+
+        mask = np.uint64(multiple - 1)
+        block = np.empty_like(multipliers)
+        blocks: list[NDArray[np.uint16]] = []
+        found = 0
         value = seed
-        if modulo == 1:
-            while True:
-                value = (value * factor) % 2147483647
-                yield value
-        else:
-            while True:
-                value = (value * factor) % 2147483647
-                if value % modulo == 0:
-                    yield value
+        while found < count:
+            block = np.remainder(
+                np.multiply(multipliers, np.uint64(value), out=block),
+                np.uint64(MODULUS),
+                out=block,
+            )
+            values = block[(block & mask) == 0] if mask else block
+            blocks.append(values.astype(np.uint16))
+            found += len(values)
+            value = value * jump % MODULUS
+
+        return np.concatenate(blocks)[:count]
 
 
 if __name__ == "__main__":  # pragma: no cover
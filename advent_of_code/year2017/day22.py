@@ -5,8 +5,6 @@ Sporifica Virus
 For puzzle specification and desciption, visit
 https://adventofcode.com/2017/day/22
 """
-from collections.abc import Callable
-from copy import deepcopy
 from pathlib import Path
 from sys import path
 
@@ -17,6 +15,19 @@ from advent_of_code.utils.parser import parse_grid, str_processor
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
+# node states, with EDGE marking the border around the grid
+CLEAN = 0
+WEAKENED = 1
+INFECTED = 2
+FLAGGED = 3
+EDGE = 4
+
+# turns, with directions numbered clockwise from up
+LEFT = -1
+AHEAD = 0
+RIGHT = 1
+REVERSE = 2
+
 
 class Solver(SolverInterface):
     """Solves the puzzle."""
@@ -42,8 +53,8 @@ class Solver(SolverInterface):
         return self._solve(
             10000,
             {
-                "#": lambda direction: ((direction + 1) % 4, "."),  # turn right
-                ".": lambda direction: ((direction - 1) % 4, "#"),  # turn left
+                CLEAN: (INFECTED, LEFT),
+                INFECTED: (CLEAN, RIGHT),
             },
         )
 
@@ -56,54 +67,108 @@ class Solver(SolverInterface):
         return self._solve(
             10000000,
             {
-                ".": lambda direction: ((direction - 1) % 4, "W"),  # turn left
-                "W": lambda direction: (direction, "#"),
-                "#": lambda direction: ((direction + 1) % 4, "F"),  # turn right
-                "F": lambda direction: ((direction + 2) % 4, "."),  # about turn
+                CLEAN: (WEAKENED, LEFT),
+                WEAKENED: (INFECTED, AHEAD),
+                INFECTED: (FLAGGED, RIGHT),
+                FLAGGED: (CLEAN, REVERSE),
             },
         )
 
-    def _solve(
-        self, cycles: int, actions: dict[str, Callable[[int], tuple[int, str]]]
-    ) -> int:
+    def _solve(self, cycles: int, rules: dict[int, tuple[int, int]]) -> int:
         """Run the simulation.
 
+        The grid is a flat bytearray of node states, surrounded by a border of
+        EDGE nodes. When the carrier reaches the border, the grid is re-centred
+        in one three times the size.
+
         Args:
             cycles (int): number of cycles fo run
-            actions (dict[str, Callable[[int], tuple[int, str]]]): the action
-                to perform on each cycle
+            rules (dict[int, tuple[int, int]]): the new state and turn for each
+                node state
 
         Returns:
             int: the number of infections
         """
-        # copy the input grid
-        grid = deepcopy(self.input)
-
-        # setup the move functions
-        moves: dict[int, Callable[[int, int], tuple[int, int]]] = {
-            0: lambda x, y: (x, y - 1),  # up
-            1: lambda x, y: (x + 1, y),  # left
-            2: lambda x, y: (x, y + 1),  # down
-            3: lambda x, y: (x - 1, y),  # right
-        }
-        direction = 0
-
-        # place the current position in the centre of the grid (odd length sides)
-        x, y = (
-            max(x1 for x1, _ in grid) // 2,
-            max(y1 for _, y1 in grid) // 2,
+        # precompute the new state, and the new direction for each state and
+        # direction pair
+        next_states = bytes(rules.get(state, (state, 0))[0] for state in range(EDGE))
+        next_directions = bytes(
+            (direction + rules.get(state, (state, 0))[1]) % 4
+            for state in range(EDGE)
+            for direction in range(4)
         )
 
+        # copy the input grid into a square one, with the carrier starting in the
+        # centre facing up
+        max_x = max(x for x, _ in self.input)
+        max_y = max(y for _, y in self.input)
+        width = max(max_x, max_y) + 3
+        grid = self._bordered(width)
+        for (x, y), value in self.input.items():
+            grid[(y + 1) * width + x + 1] = INFECTED if value == "#" else CLEAN
+        position = (max_y // 2 + 1) * width + max_x // 2 + 1
+        direction = 0
+        moves = (-width, 1, width, -1)
+
         # run the simulation, counting the number of infections
         infections = 0
         for _ in range(cycles):
-            direction, grid[(x, y)] = actions[grid.get((x, y), ".")](direction)
-            if grid[(x, y)] == "#":
+            state = grid[position]
+            if state == EDGE:
+                grid, width, position = self._grow(grid, width, position)
+                moves = (-width, 1, width, -1)
+                state = grid[position]
+            direction = next_directions[state << 2 | direction]
+            state = next_states[state]
+            grid[position] = state
+            if state == INFECTED:
                 infections += 1
-            x, y = moves[direction](x, y)
+            position += moves[direction]
 
         return infections
 
+    def _bordered(self, width: int) -> bytearray:
+        """Create a clean square grid, surrounded by a border of EDGE nodes.
+
+        Args:
+            width (int): the width of the grid, including the border
+
+        Returns:
+            bytearray: the grid, one row after another
+        """
+        grid = bytearray(width * width)
+        grid[:width] = grid[-width:] = bytes([EDGE]) * width
+        grid[::width] = grid[width - 1 :: width] = bytes([EDGE]) * width
+        return grid
+
+    def _grow(
+        self, grid: bytearray, width: int, position: int
+    ) -> tuple[bytearray, int, int]:
+        """Re-centre the grid in one three times the size.
+
+        The old grid is surrounded by its own width of clean nodes, so the carrier
+        is always well inside the new border.
+
+        Args:
+            grid (bytearray): the grid
+            width (int): the width of the grid, including the border
+            position (int): the position of the carrier, on the border
+
+        Returns:
+            tuple[bytearray, int, int]: the new grid, its width and the position of
+                the carrier in it
+        """
+        shift = width - 2
+        new_width = (width - 2) * 3 + 2
+        new_grid = self._bordered(new_width)
+        for y in range(1, width - 1):
+            start = (y + shift) * new_width + shift
+            new_grid[start + 1 : start + width - 1] = grid[
+                y * width + 1 : (y + 1) * width - 1
+            ]
+        y, x = divmod(position, width)
+        return new_grid, new_width, (y + shift) * new_width + x + shift
+
 
 if __name__ == "__main__":  # pragma: no cover
     runner(Solver)
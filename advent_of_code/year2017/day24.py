@@ -32,14 +32,18 @@ class Solver(SolverInterface):
         """
         self.input = parse_lines(puzzle_input, (r"(\d+)/(\d+)", int_tuple_processor))
 
-        self.lookup = defaultdict(list)
-        for a, b in self.input:
-            self.lookup[a].append(b)
-            self.lookup[b].append(a)
-
-        self.strongest = 0
-        self.longest_length = 0
-        self.longest_strength = 0
+        # index the components by bit, with double ports kept apart as they can
+        # always be added to a bridge without changing its open port
+        self.lookup: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        self.doubles: defaultdict[int, int] = defaultdict(int)
+        for i, (a, b) in enumerate(self.input):
+            if a == b:
+                self.doubles[a] |= 1 << i
+            else:
+                self.lookup[a].append((1 << i, b))
+                self.lookup[b].append((1 << i, a))
+
+        self.seen: dict[tuple[int, int], tuple[int, int, int]] = {}
 
     def solve_part_one(self) -> int:
         """Solve part one of the puzzle.
@@ -47,10 +51,8 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        if self.strongest == 0:
-            self._solve(0, set())
-
-        return self.strongest
+        strongest, _, _ = self._solve(0, 0)
+        return strongest
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
@@ -58,36 +60,45 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        if self.longest_strength == 0:
-            self._solve(0, set())
-
-        return self.longest_strength
+        _, _, longest_strength = self._solve(0, 0)
+        return longest_strength
 
-    def _solve(self, a: int, bridge: set[tuple[int, int]]) -> None:
-        """Recusively solve the puzzle.
+    def _solve(self, port: int, used: int) -> tuple[int, int, int]:
+        """Recusively find the best ways to extend a bridge.
 
         Args:
-            a (int): the "a" connector
-            bridge (set[tuple[int, int]]): the bridge so far
+            port (int): the open port at the end of the bridge
+            used (int): bitmask of the components in the bridge
+
+        Returns:
+            tuple[int, int, int]: the strongest extension, and the length and
+                strength of the longest (then strongest) extension
         """
-        end = True
-        for b in self.lookup[a]:
-            if not ((a, b) in bridge or (b, a) in bridge):
-                end = False
-                self._solve(b, bridge | {(a, b)})
-
-        if end:
-            strength = sum(a + b for a, b in bridge)
-            length = len(bridge)
-
-            if strength > self.strongest:
-                self.strongest = strength
-
-            if length > self.longest_length or (
-                length == self.longest_length and strength > self.longest_strength
-            ):
-                self.longest_strength = strength
-                self.longest_length = length
+        if (port, used) in self.seen:
+            return self.seen[(port, used)]
+
+        if doubles := self.doubles[port] & ~used:
+            # always add the unused double ports, as they leave the port unchanged
+            strongest, length, strength = self._solve(port, used | doubles)
+            count = doubles.bit_count()
+            result = (
+                strongest + 2 * port * count,
+                length + count,
+                strength + 2 * port * count,
+            )
+        else:
+            strongest, length, strength = 0, 0, 0
+            for bit, other in self.lookup[port]:
+                if not used & bit:
+                    rest = self._solve(other, used | bit)
+                    strongest = max(strongest, rest[0] + port + other)
+                    length, strength = max(
+                        (length, strength), (rest[1] + 1, rest[2] + port + other)
+                    )
+            result = (strongest, length, strength)
+
+        self.seen[(port, used)] = result
+        return result
 
 
 if __name__ == "__main__":  # pragma: no cover
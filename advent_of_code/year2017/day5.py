@@ -5,7 +5,9 @@ A Maze of Twisty Trampolines, All Alike
 For puzzle specification and desciption, visit
 https://adventofcode.com/2017/day/5
 """
-from copy import deepcopy
+from __future__ import annotations
+
+from array import array
 from pathlib import Path
 from sys import path
 
@@ -16,6 +18,8 @@ from advent_of_code.utils.parser import int_processor, parse_lines
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
+BLOCK_SIZE = 32
+
 
 class Solver(SolverInterface):
     """Solves the puzzle."""
@@ -38,13 +42,14 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        instructions = deepcopy(self.input)
+        instructions = array("i", self.input)
+        size = len(instructions)
         steps = 0
 
         i = 0
-        while 0 <= i < len(instructions):
+        while 0 <= i < size:
             offset = instructions[i]
-            instructions[i] += 1
+            instructions[i] = offset + 1
             i += offset
             steps += 1
 
@@ -53,24 +58,93 @@ class Solver(SolverInterface):
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
 
+        Offsets soon settle into a prefix that only holds 2s and 3s, which flip
+        between each other and always jump forward. The settled prefix is held as
+        blocks of bits (set for a 3), and crossing a block is looked up in a table
+        of block transitions, rather than stepping through it one jump at a time.
+
         Returns:
             int: the answer
         """
-        instructions = deepcopy(self.input)
+        instructions = array("i", self.input)
+        size = len(instructions)
+        blocks: list[int] = []
+        transitions: dict[int, tuple[int, int, int]] = {}
+        settled = 0
+        unsettled = self._count_unsettled(instructions, settled)
         steps = 0
 
         i = 0
-        while 0 <= i < len(instructions):
+        while 0 <= i < size:
+            # jump across settled blocks, using the memoised transitions
+            if i < settled:
+                block, entry = divmod(i, BLOCK_SIZE)
+                while block < len(blocks):
+                    key = blocks[block] << BLOCK_SIZE | entry
+                    if key not in transitions:
+                        transitions[key] = self._cross_block(blocks[block], entry)
+                    blocks[block], entry, block_steps = transitions[key]
+                    steps += block_steps
+                    block += 1
+                i = block * BLOCK_SIZE + entry
+                continue
+
             offset = instructions[i]
-            if offset < 3:
-                instructions[i] += 1
-            else:
-                instructions[i] -= 1
-            i += offset
+            instructions[i] = offset + 1 if offset < 3 else offset - 1
             steps += 1
 
+            # extend the settled prefix, once the next block has settled
+            if i - settled < BLOCK_SIZE and offset in (1, 4):
+                unsettled = self._count_unsettled(instructions, settled)
+            while unsettled == 0 and settled + BLOCK_SIZE <= size:
+                blocks.append(
+                    sum(
+                        1 << j
+                        for j, x in enumerate(
+                            instructions[settled : settled + BLOCK_SIZE]
+                        )
+                        if x == 3
+                    )
+                )
+                settled += BLOCK_SIZE
+                unsettled = self._count_unsettled(instructions, settled)
+
+            i += offset
+
         return steps
 
+    def _count_unsettled(self, instructions: array[int], start: int) -> int:
+        """Count the offsets in a block that have not yet settled to a 2 or 3.
+
+        Args:
+            instructions (array[int]): the offsets
+            start (int): the start of the block
+
+        Returns:
+            int: the number of unsettled offsets
+        """
+        return sum(not 2 <= x <= 3 for x in instructions[start : start + BLOCK_SIZE])
+
+    def _cross_block(self, bits: int, entry: int) -> tuple[int, int, int]:
+        """Jump across a settled block, where each offset is 2 or 3.
+
+        Args:
+            bits (int): the offsets in the block, with bits set for a 3
+            entry (int): the position in the block to start from
+
+        Returns:
+            tuple[int, int, int]: the new bits, the position after the block to
+                continue from, and the number of steps taken
+        """
+        steps = 0
+        i = entry
+        while i < BLOCK_SIZE:
+            offset = 2 + ((bits >> i) & 1)
+            bits ^= 1 << i
+            i += offset
+            steps += 1
+        return bits, i - BLOCK_SIZE, steps
+
 
 if __name__ == "__main__":  # pragma: no cover
     runner(Solver)
@@ -5,6 +5,7 @@ Chocolate Charts
 For puzzle specification and desciption, visit
 https://adventofcode.com/2018/day/14
 """
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from sys import path
@@ -17,6 +18,8 @@ from advent_of_code.utils.parser import parse_single_line, str_processor
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
+BATCH_SIZE = 1 << 16
+
 
 @dataclass
 class Link:
@@ -48,17 +51,12 @@ class Solver(SolverInterface):
         Returns:
             str: the answer
         """
-        scores = [3, 7]
-        elf_one = 0
-        elf_two = 1
-
         number = int(self.input)
-        while len(scores) <= (number + 10):
-            total = scores[elf_one] + scores[elf_two]
-            scores.extend([total] if total < 10 else divmod(total, 10))
-            elf_one = (elf_one + scores[elf_one] + 1) % len(scores)
-            elf_two = (elf_two + scores[elf_two] + 1) % len(scores)
-
+        scores, length = next(
+            (scores, length)
+            for scores, length in self._scoreboard()
+            if length >= number + 10
+        )
         return "".join(str(score) for score in scores[number : number + 10])
 
     def solve_part_two(self) -> int:
@@ -67,24 +65,57 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        scores = [3, 7]
-        elf_one = 0
-        elf_two = 1
+        digits = bytes(int(x) for x in self.input)
 
-        digits = [int(x) for x in self.input]
+        # search the newly created recipes, overlapping with the previous search
+        start = 0
+        for scores, length in self._scoreboard():
+            if (found := scores.find(digits, start, length)) != -1:
+                return found
+            start = max(0, length - len(digits) + 1)
 
-        while (
-            digits != scores[-len(digits) :]
-            and digits != scores[(-len(digits) - 1) : -1]
-        ):
-            total = scores[elf_one] + scores[elf_two]
-            scores.extend([total] if total < 10 else divmod(total, 10))
-            elf_one = (elf_one + scores[elf_one] + 1) % len(scores)
-            elf_two = (elf_two + scores[elf_two] + 1) % len(scores)
+        return -1  # pragma: no cover
 
-        return (
-            len(scores) - len(digits) - (0 if scores[-len(digits) :] == digits else 1)
-        )
+    def _scoreboard(self) -> Iterator[tuple[bytearray, int]]:
+        """Create new recipes, in batches.
+
+        The scoreboard is a bytearray, which doubles in size when full, and is
+        only valid up to the length yielded with it.
+
+        Yields:
+            tuple[bytearray, int]: the scoreboard, and the number of recipes on it
+        """
+        scores = bytearray(BATCH_SIZE)
+        scores[:2] = (3, 7)
+        length = 2
+        elf_one = 0
+        elf_two = 1
+
+        while True:
+            if length + BATCH_SIZE + 1 > len(scores):
+                scores.extend(bytes(len(scores)))
+
+            stop = length + BATCH_SIZE
+            while length < stop:
+                score_one = scores[elf_one]
+                score_two = scores[elf_two]
+                total = score_one + score_two
+                if total < 10:
+                    scores[length] = total
+                    length += 1
+                else:
+                    scores[length] = 1
+                    scores[length + 1] = total - 10
+                    length += 2
+
+                elf_one += score_one + 1
+                if elf_one >= length:
+                    elf_one %= length
+                elf_two += score_two + 1
+                if elf_two >= length:
+                    elf_two %= length
+
+            yield scores, length
 
 
 if __name__ == "__main__":  # pragma: no cover
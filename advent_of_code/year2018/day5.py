@@ -6,8 +6,7 @@ For puzzle specification and desciption, visit
 https://adventofcode.com/2018/day/5
 """
 from pathlib import Path
-from string import ascii_lowercase, ascii_uppercase
-from sys import maxsize, path
+from sys import path
 
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
@@ -38,46 +37,42 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        return len(self._react(list(self.input)))
+        return len(self._react(self.input.encode()))
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
 
+        Removing a unit type cannot stop any other units from reacting, so each
+        removal starts from the already reacted polymer.
+
         Returns:
             int: the answer
         """
-        lowest = maxsize
-        for lower, upper in zip(ascii_lowercase, ascii_uppercase):
-            lowest = min(lowest, len(self._react(list(self.input), f"{lower}{upper}")))
+        polymer = self._react(self.input.encode())
+        return min(len(self._react(polymer, unit)) for unit in set(polymer.lower()))
 
-        return lowest
+    def _react(self, polymer: bytes, remove: int = 0) -> bytes:
+        """Perform a polymer reaction, in a single pass with a stack.
 
-    def _react(self, polymer: list[str], remove: str = "") -> list[str]:
-        """Perform a polymer reaction.
+        Units of the same type in opposite polarities differ only by the 0x20
+        bit of their ASCII code.
 
         Args:
-            polymer (list[str]): The polymer to react
-            remove (str): any types to ignore
+            polymer (bytes): The polymer to react
+            remove (int): the lowercase ASCII code of a unit type to ignore
 
         Returns:
-            list[str]: the result
+            bytes: the result
         """
-        result = list(polymer)
-        i = 0
-        while i < len(result) - 1:
-            if result[i] in remove:
-                result.pop(i)
-                i = max(0, i - 1)
-            if result[i].lower() == result[i + 1].lower() and (
-                (result[i].islower() and result[i + 1].isupper())
-                or (result[i].isupper() and result[i + 1].islower())
-            ):
-                result.pop(i + 1)
-                result.pop(i)
-                i = max(0, i - 1)
+        result = bytearray()
+        for unit in polymer:
+            if unit | 0x20 == remove:
+                continue
+            if result and result[-1] ^ unit == 0x20:
+                result.pop()
             else:
-                i += 1
-        return result
+                result.append(unit)
+        return bytes(result)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,17 +5,21 @@ Chronal Coordinates
 For puzzle specification and desciption, visit
 https://adventofcode.com/2018/day/6
 """
-from collections import Counter
 from pathlib import Path
 from sys import path
 
+import numpy as np
+
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
 from advent_of_code.utils.parser import int_tuple_processor, parse_lines
 from advent_of_code.utils.runner import runner
+from advent_of_code.utils.solver_decorators import cache_result
 from advent_of_code.utils.solver_interface import SolverInterface
 
+SAFE_DISTANCE = 10000
+
 
 class Solver(SolverInterface):
     """Solves the puzzle."""
@@ -40,38 +44,7 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        # find the min and max point
-        min_x = min(x for x, _ in self.input)
-        max_x = max(x for x, _ in self.input)
-        min_y = min(y for _, y in self.input)
-        max_y = max(y for _, y in self.input)
-
-        # find the areas
-        grid = {}
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                dist = [
-                    (abs(input_x - x) + abs(input_y - y), i)
-                    for i, (input_x, input_y) in enumerate(self.input)
-                ]
-                dist.sort(key=lambda x: x[0])
-
-                if dist[0][0] != dist[1][0]:
-                    grid[(x, y)] = dist[0][1]
-
-        # find the infinite groups
-        edges = (
-            {(x, min_y) for x in range(min_x, max_x + 1)}
-            | {(x, max_y) for x in range(min_x, max_x + 1)}
-            | {(min_x, y) for y in range(min_y, max_y + 1)}
-            | {(max_x, y) for y in range(min_y, max_y + 1)}
-        )
-        infinite = {group for point, group in grid.items() if point in edges}
-
-        # find the answer
-        return Counter(
-            filter(lambda group: group not in infinite, grid.values())
-        ).most_common(1)[0][1]
+        return self._areas()[0]
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
@@ -79,24 +52,43 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        # find the min and max point
-        min_x = min(x for x, _ in self.input)
-        max_x = max(x for x, _ in self.input)
-        min_y = min(y for _, y in self.input)
-        max_y = max(y for _, y in self.input)
-
-        # find the area
-        size = 0
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                total = sum(
-                    abs(input_x - x) + abs(input_y - y)
-                    for i, (input_x, input_y) in enumerate(self.input)
-                )
-                if total < 10000:
-                    size += 1
-
-        return size
+        return self._areas()[1]
+
+    @cache_result
+    def _areas(self) -> tuple[int, int]:
+        """Find the largest finite area and the size of the safe region.
+
+        The distances from every point to every location in the bounding box are
+        found at once, with NumPy broadcasting, and both parts are answered from
+        them. Any area reaching the edge of the box grows without limit.
+
+        Returns:
+            tuple[int, int]: the largest finite area, and the size of the region
+                within the safe total distance of all the points
+        """
+        points = np.array(self.input, dtype=np.int32)
+        min_x, min_y = points.min(axis=0)
+        max_x, max_y = points.max(axis=0)
+        xs = np.arange(min_x, max_x + 1, dtype=np.int32)
+        ys = np.arange(min_y, max_y + 1, dtype=np.int32)
+
+        # distances indexed by point, y and x
+        distances = np.abs(points[:, 0, None, None] - xs) + np.abs(
+            points[:, 1, None, None] - ys[:, None]
+        )
+
+        # find the nearest point to each location, or -1 for a tie
+        nearest = distances.min(axis=0)
+        tied = (distances == nearest).sum(axis=0) > 1
+        owners = np.where(tied, -1, distances.argmin(axis=0))
+
+        # count the areas, ignoring ties and the infinite areas on the edges
+        areas = np.bincount(owners[~tied], minlength=len(points))
+        edges = np.concatenate((owners[0], owners[-1], owners[:, 0], owners[:, -1]))
+        areas[edges[edges >= 0]] = 0
+
+        safe = np.count_nonzero(distances.sum(axis=0) < SAFE_DISTANCE)
+        return int(areas.max()), int(safe)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,7 +5,7 @@ Marble Mania
 For puzzle specification and desciption, visit
 https://adventofcode.com/2018/day/9
 """
-from collections import defaultdict, deque
+from array import array
 from pathlib import Path
 from sys import path
 
@@ -55,6 +55,14 @@ class Solver(SolverInterface):
     def _solve(self, number_of_players: int, last_marble: int) -> int:
         """Solve the puzzle.
 
+        The circle is held as a queue in a preallocated array, listed clockwise
+        from the marble after the current marble, which is last. Between scores,
+        each marble is placed after the next marble clockwise, so a batch of 22
+        marbles takes 22 marbles from the front of the queue and adds them back
+        to the end, interleaved with the batch. The 23rd marble then removes
+        the 19th of those, and the 6 marbles after the new current marble move
+        back to the front. A whole batch is a few slice copies.
+
         Args:
             number_of_players (int): how many players are playing
             last_marble (int): what will be the last marble played
@@ -62,25 +70,36 @@ class Solver(SolverInterface):
         Returns:
             int: the result
         """
-        # use a double ended queue as the circle, with the right
-        # hand element being the current marble
-        marbles = deque([0])
-
-        scores: defaultdict[int, int] = defaultdict(int)
-        current_player = 1
-
-        for i in range(1, last_marble + 1):
-            if i % 23 != 0:
-                marbles.rotate(-1)
-                marbles.append(i)
-            else:
-                marbles.rotate(7)
-                scores[current_player] += marbles.pop() + i
-                marbles.rotate(-1)
-
-            current_player = (current_player + 1) % number_of_players
-
-        return max(scores.values())
+        scores = [0] * number_of_players
+
+        # play the first batch in a list, while the circle is too small
+        circle = [0]
+        current = 0
+        for marble in range(1, 23):
+            current = (current + 1) % len(circle) + 1
+            circle.insert(current, marble)
+        if last_marble >= 23:
+            current = (current - 7) % len(circle)
+            scores[23 % number_of_players] += 23 + circle.pop(current)
+
+        # the queue grows by 37 marbles for each later batch
+        queue = array("I", bytes(4 * (len(circle) + 37 * (last_marble // 23))))
+        queue[: len(circle)] = array("I", circle[current + 1 :] + circle[: current + 1])
+        head, tail = 0, len(circle)
+        numbers = array("I", range(last_marble + 1))
+
+        for base in range(23, last_marble - 22, 23):
+            following = queue[head : head + 22]
+            head += 16
+            queue[head : head + 6 : 2] = following[19:]
+            queue[head + 1 : head + 6 : 2] = numbers[base + 20 : base + 23]
+            queue[tail : tail + 36 : 2] = following[:18]
+            queue[tail + 1 : tail + 36 : 2] = numbers[base + 1 : base + 19]
+            queue[tail + 36] = base + 19
+            tail += 37
+            scores[(base + 23) % number_of_players] += base + 23 + following[18]
+
+        return max(scores)
 
 
 if __name__ == "__main__":  # pragma: no cover
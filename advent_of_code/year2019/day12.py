@@ -5,13 +5,15 @@ The N-Body Problem
 For puzzle specification and desciption, visit
 https://adventofcode.com/2019/day/12
 """
-from copy import deepcopy
-from dataclasses import dataclass, field
-from itertools import permutations
+from collections.abc import Iterator
+from itertools import islice
 from math import lcm
 from pathlib import Path
 from sys import path
 
+import numpy as np
+from numpy.typing import NDArray
+
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
@@ -33,17 +35,7 @@ class Solver(SolverInterface):
         Args:
             puzzle_input (list[str]): The lines of the input file
         """
-        self.input = [
-            Moon(list(m))
-            for m in parse_lines(
-                puzzle_input,
-                (
-                    r"<x=(-?\d+), y=(-?\d+), z=(-?\d+)>",
-                    int_tuple_processor,
-                ),
-            )
-        ]
-        self.input_tuples = parse_lines(
+        self.input = parse_lines(
             puzzle_input,
             (
                 r"<x=(-?\d+), y=(-?\d+), z=(-?\d+)>",
@@ -57,13 +49,9 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        jupiter = Planet(deepcopy(self.input))
-        for _ in range(1000):
-            jupiter.tick()
-
-        return sum(
-            sum(abs(a) for a in m.position) * sum(abs(a) for a in m.velocity)
-            for m in jupiter.moons
+        positions, velocities = next(islice(self._simulate(), 999, None))
+        return int(
+            (np.abs(positions).sum(axis=0) * np.abs(velocities).sum(axis=0)).sum()
         )
 
     def solve_part_two(self) -> int:
@@ -72,59 +60,51 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        jupiter = Planet(deepcopy(self.input))
-        cycles = [0, 0, 0]  # [x, y, z]
-        tick = 0
-
-        while not all(i for i in cycles):
-            jupiter.tick()
-            tick += 1
-
-            # look for the cycle half way point, when all velocities on the axis are 0
-            for a in range(3):
-                if not cycles[a] and all(not m.velocity[a] for m in jupiter.moons):
-                    cycles[a] = tick * 2
+        # return the lowest common multiple of the periods, ie the first time all
+        # three axes are back to their starting positions
+        return lcm(*self._periods())
 
-        # return the lowest common multiple of the cycle lengths, ie the first time
-        # all three axis are back to their starting positions
-        return lcm(*cycles)
+    def _periods(self) -> list[int]:
+        """Find the period of each axis, which all move independently.
 
+        Each axis is half way through its cycle when all its velocities are 0.
 
-@dataclass
-class Moon:
-    """A Moon."""
-
-    position: list[int]
-    velocity: list[int] = field(default_factory=lambda: [0, 0, 0])
-
-    def apply_gravity(self, other: "Moon") -> None:
-        """Apply gravity to this moon based on position of other.
-
-        Args:
-            other (Moon): the other moon
+        Returns:
+            list[int]: the period of each axis
         """
-        self.velocity = [
-            v if s == o else v + (1 if s < o else -1)
-            for (s, o, v) in zip(self.position, other.position, self.velocity)
-        ]
-
-    def tick(self) -> None:
-        """Move one tick in time."""
-        self.position = [p + v for p, v in zip(self.position, self.velocity)]
-
-
-@dataclass
-class Planet:
-    """A planet."""
-
-    moons: list[Moon]
-
-    def tick(self) -> None:
-        """Tick the time forward."""
-        for a, b in permutations(self.moons, 2):
-            a.apply_gravity(b)
-        for m in self.moons:
-            m.tick()
+        periods = [0, 0, 0]
+        for tick, (_, velocities) in enumerate(self._simulate(), start=1):
+            if np.count_nonzero(velocities) < velocities.size:
+                for axis in np.flatnonzero(~velocities.any(axis=1)):
+                    periods[axis] = periods[axis] or tick * 2
+                if all(periods):
+                    break
+        return periods
+
+    def _simulate(self) -> Iterator[tuple[NDArray[np.int64], NDArray[np.int64]]]:
+        """Iterator for the moons after each tick, with the three axes side by side.
+
+        Gravity is applied to each pair of moons at once, by multiplying the signs
+        of their separations with a matrix adding each to one moon of the pair
+        and subtracting it from the other.
+
+        Yields:
+            tuple[NDArray[np.int64], NDArray[np.int64]]: the positions and
+                velocities, indexed by axis then moon, which are updated in place
+        """
+        positions = np.array(self.input, dtype=np.int64).T.copy()
+        velocities = np.zeros_like(positions)
+
+        first, second = np.triu_indices(len(self.input), 1)
+        pulls = np.zeros((len(first), len(self.input)), dtype=np.int64)
+        pulls[np.arange(len(first)), first] = 1
+        pulls[np.arange(len(first)), second] = -1
+
+        while True:
+            separations = positions.take(second, axis=1) - positions.take(first, axis=1)
+            velocities += np.dot(np.sign(separations), pulls)
+            positions += velocities
+            yield positions, velocities
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -6,10 +6,9 @@ For puzzle specification and desciption, visit
 https://adventofcode.com/2019/day/18
 """
 from collections import deque
-from heapq import heapify, heappop, heappush
-from itertools import chain
+from heapq import heappop, heappush
 from pathlib import Path
-from sys import path
+from sys import maxsize, path
 
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
@@ -67,35 +66,34 @@ class Solver(SolverInterface):
     def _solve(self, grid: dict[tuple[int, int], str]) -> int:
         """Solve the puzzle, using Dysktra's Algorithm.
 
+        Keys and doors are held as 26 bit integers, with bit 0 for key a.
+
         Args:
             grid (dict[tuple[int, int], str]): the input grid to use
 
         Returns:
             int: the shortest path to collect all the keys in the grid
         """
-        # a set of all the keys to find
-        keys_to_find = {v: (x, y) for (x, y), v in self.input.items() if v.islower()}
-        # place a robot at each of the starting locations
+        # a bitmask of all the keys to find
+        all_keys = sum(1 << self._bit(v) for v in grid.values() if v.islower())
+
+        # place a robot at each of the starting locations, labelled after the keys
         starting_locations = {
             k: str(i) for i, k in enumerate(k for k, v in grid.items() if v == "@")
         }
         grid = grid | starting_locations
-        robots = tuple(starting_locations.values())
+        robots = tuple(self._bit(label) for label in starting_locations.values())
 
-        # find all the routes
-        routes = {k: self._find_routes(k, grid) for k in chain(keys_to_find, robots)}
+        # find all the routes between the keys and from the robots
+        routes = {
+            self._bit(v): self._find_routes(k, grid)
+            for k, v in grid.items()
+            if v.islower() or v in starting_locations.values()
+        }
 
         # start Dykstra's algorithm with an initial state
-        state: tuple[int, tuple[str, ...], frozenset[str]] = (
-            0,
-            robots,
-            frozenset({}),
-        )
-        queue = [state]
-        distances: dict[tuple[tuple[str, ...], frozenset[str]], int] = {
-            (robots, frozenset()): 0
-        }
-        heapify(queue)
+        queue = [(0, robots, 0)]
+        distances = {(robots, 0): 0}
 
         result = -1
         while queue:
@@ -103,56 +101,64 @@ class Solver(SolverInterface):
             distance, robots, keys_in_hand = heappop(queue)
 
             # terminate once all keys have been found
-            if len(keys_in_hand) == len(keys_to_find):
+            if keys_in_hand == all_keys:
                 result = distance
                 break
+            if distance > distances[(robots, keys_in_hand)]:
+                continue
 
             # all all the possible next states to the queue
             for i, robot in enumerate(robots):
-                for dest, (keys_required, additional_distance) in routes[robot].items():
-                    if keys_required <= keys_in_hand:
-                        # found a route we can unlock
+                for dest, doors, keys, additional_distance in routes[robot]:
+                    if not (1 << dest) & keys_in_hand and not doors & ~keys_in_hand:
+                        # found a new key behind doors we can unlock, collecting
+                        # any other keys along the way
                         tentative = distance + additional_distance
-                        next_robots = list(robots)
-                        next_robots[i] = dest
                         next_state = (
-                            tuple(next_robots),
-                            keys_in_hand | {dest},
+                            (*robots[:i], dest, *robots[i + 1 :]),
+                            keys_in_hand | keys,
                         )
-                        if (
-                            next_state not in distances
-                            or tentative < distances[next_state]
-                        ):
+                        if tentative < distances.get(next_state, maxsize):
                             # found the best distance so far
                             distances[next_state] = tentative
                             heappush(queue, (tentative, *next_state))
 
         return result
 
+    def _bit(self, label: str) -> int:
+        """Find the bit index for a key, door or robot label.
+
+        Args:
+            label (str): the label, as a key, door or robot number
+
+        Returns:
+            int: the bit index, with robots numbered after the keys
+        """
+        if label.isdigit():
+            return 26 + int(label)
+        return ord(label.lower()) - ord("a")
+
     def _find_routes(
-        self, start: str, grid: dict[tuple[int, int], str]
-    ) -> dict[str, tuple[frozenset[str], int]]:
-        """Find routes from the start key to the next key.
+        self, start: tuple[int, int], grid: dict[tuple[int, int], str]
+    ) -> list[tuple[int, int, int, int]]:
+        """Find routes from the start to each of the keys.
 
         Args:
-            start (str): the start key
+            start (tuple[int, int]): the start location
             grid (dict[tuple[int, int], str]): the grid to explore
 
         Returns:
-            dict[str, tuple[frozenset[str], int]]: the results
+            list[tuple[int, int, int, int]]: the key, bitmask of doors on the route,
+                bitmask of keys collected on the route, and distance
         """
-        start_location = next((x, y) for (x, y), v in grid.items() if v == start)
-
-        # use a depth first search to explore the grid
-        results: dict[str, tuple[frozenset[str], int]] = {}
-        queue: deque[tuple[tuple[int, int], int, frozenset[str]]] = deque(
-            [(start_location, 0, frozenset())]
-        )
-        visited = {start_location}
+        # use a breadth first search to explore the grid
+        results: list[tuple[int, int, int, int]] = []
+        queue = deque([(start, 0, 0, 0)])
+        visited = {start}
 
         while queue:
             # pop the next location off the queue
-            (x, y), steps, keys_required = queue.popleft()
+            (x, y), steps, doors, keys = queue.popleft()
 
             # generate the next moves
             moves = (
@@ -163,17 +169,17 @@ class Solver(SolverInterface):
 
             for move, item in moves:
                 visited.add(move)
+                next_doors, next_keys = doors, keys
                 if item.isupper():
-                    # found a door, so add it's key to keys_required
-                    queue.append(
-                        (move, steps + 1, frozenset(keys_required | {item.lower()}))
-                    )
+                    # found a door, so add it to the doors on the route
+                    next_doors |= 1 << self._bit(item)
                 elif item.islower():
-                    # found a key
-                    results[item] = (keys_required, steps + 1)
-                else:
-                    # add the next step to the queue
-                    queue.append((move, steps + 1, keys_required))
+                    # found a key, which is collected on the way to any beyond
+                    next_keys |= 1 << self._bit(item)
+                    results.append((self._bit(item), doors, next_keys, steps + 1))
+
+                # add the next step to the queue
+                queue.append((move, steps + 1, next_doors, next_keys))
 
         return results
 
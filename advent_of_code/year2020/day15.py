@@ -5,6 +5,11 @@ Rambunctious Recitation
 For puzzle specification and desciption, visit
 https://adventofcode.com/2020/day/15
 """
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterator
 from pathlib import Path
 from sys import path
 
@@ -50,11 +55,45 @@ class Solver(SolverInterface):
         return self._solve(30000000)
 
     def _solve(self, steps: int) -> int:
-        mem = {x: i + 1 for i, x in enumerate(self.input)}
+        """Find the number spoken on the last step.
+
+        Args:
+            steps (int): the number of steps
+
+        Returns:
+            int: the last number spoken
+        """
+        last_block = deque(self._spoken(steps), maxlen=1)[0]
+        return last_block[-1]
+
+    def _spoken(self, steps: int, block_size: int = 1 << 16) -> Iterator[array[int]]:
+        """Iterate over the numbers spoken, in blocks.
+
+        The turn each number was last spoken is kept in a preallocated array,
+        indexed by the number, with zero for never spoken.
+
+        Args:
+            steps (int): the number of steps
+            block_size (int): the size of each block. Defaults to 65536.
+
+        Yields:
+            array[int]: the next block of numbers spoken
+        """
+        memory = array("I", [0]) * max(steps, max(self.input) + 1)
+        for turn, number in enumerate(self.input[:-1], start=1):
+            memory[number] = turn
         last = self.input[-1]
-        for i in range(len(self.input), steps):
-            mem[last], last = (i, i - mem.get(last, i))
-        return last
+
+        yield array("I", self.input[:steps])
+        for start in range(len(self.input), steps, block_size):
+            block = array("I")
+            append = block.append
+            for turn in range(start, min(start + block_size, steps)):
+                previous = memory[last]
+                memory[last] = turn
+                last = turn - previous if previous else 0
+                append(last)
+            yield block
 
 
 if __name__ == "__main__":  # pragma: no cover
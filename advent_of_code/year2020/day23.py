@@ -5,12 +5,14 @@ Crab Cups
 For puzzle specification and desciption, visit
 https://adventofcode.com/2020/day/23
 """
+from itertools import chain
 from pathlib import Path
 from sys import path
 
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
+from advent_of_code.utils.circular_list import CircularList
 from advent_of_code.utils.parser import int_processor, parse_tokens_single_line
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
@@ -59,45 +61,37 @@ class Solver(SolverInterface):
         Returns:
             list[int]: the final order, after cup 1
         """
-        # create a list of cups in play
-        cups = list(self.input)
-        cups.extend(range(len(cups) + 1, number_of_cups + 1))
-        current_cup = cups[0]
-
-        # create a linked list in a array
-        linked_list = [0] * (len(cups) + 1)
-        for i in range(len(cups) - 1):
-            linked_list[cups[i]] = cups[i + 1]
-        linked_list[cups[-1]] = current_cup
+        # link the cups in play into a circle
+        cups = CircularList(
+            chain(self.input, range(len(self.input) + 1, number_of_cups + 1))
+        )
+        successors = cups.successors
+        current_cup = self.input[0]
 
         for _ in range(cycles):
-            # get the next three cups, and remember what the next cup will be
-            cup1 = linked_list[current_cup]
-            cup2 = linked_list[cup1]
-            cup3 = linked_list[cup2]
-            next_cup = linked_list[cup3]
-
-            # work out the destination
-            dest = number_of_cups if current_cup == 1 else current_cup - 1
-            while dest in [cup1, cup2, cup3]:
-                dest = number_of_cups if dest == 1 else dest - 1
-
-            # remove the three cups from the linked list
-            # and place after the destination cup
-            linked_list[current_cup] = linked_list[cup3]
-            linked_list[cup3] = linked_list[dest]
-            linked_list[dest] = cup1
+            # get the next three cups
+            cup1 = successors[current_cup]
+            cup2 = successors[cup1]
+            cup3 = successors[cup2]
+
+            # work out the destination, comparing one cup at a time rather than
+            # building a tuple of them on every move
+            dest = current_cup - 1 or number_of_cups
+            while dest == cup1 or dest == cup2 or dest == cup3:  # noqa: SIM109
+                dest = dest - 1 or number_of_cups
+
+            # remove the three cups from the circle and place after the
+            # destination cup, updating the successors directly as the
+            # hottest loop of the puzzle
+            successors[current_cup] = successors[cup3]
+            successors[cup3] = successors[dest]
+            successors[dest] = cup1
 
             # move to the next cup
-            current_cup = next_cup
-
-        # put the linked list into readable order, following cup 1
-        result: list[int] = []
-        x = linked_list[1]
-        while x != 1:
-            result.append(x)
-            x = linked_list[x]
-        return result
+            current_cup = successors[current_cup]
+
+        # put the cups into readable order, following cup 1
+        return list(cups.values_after(1))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,7 +5,7 @@ Passage Pathing
 For puzzle specification and desciption, visit
 https://adventofcode.com/2021/day/12
 """
-from collections import Counter, deque
+from functools import cache
 from pathlib import Path
 from sys import path
 
@@ -30,11 +30,22 @@ class Solver(SolverInterface):
         Args:
             puzzle_input (list[str]): The lines of the input file
         """
-        self.input: dict[str, set[str]] = {}
         parsed = parse_lines(puzzle_input, (r"(\w+)-(\w+)", str_tuple_processor))
+
+        # intern the caves as ids, with a bit for each small cave
+        ids: dict[str, int] = {"start": 0, "end": 1}
+        for a, b in parsed:
+            ids.setdefault(a, len(ids))
+            ids.setdefault(b, len(ids))
+        self.small_caves = [1 << i if x.islower() else 0 for x, i in ids.items()]
+
+        # the caves reachable from each cave, never returning to the start
+        self.input: list[list[int]] = [[] for _ in ids]
         for a, b in parsed:
-            self.input.setdefault(a, set()).add(b)
-            self.input.setdefault(b, set()).add(a)
+            if b != "start":
+                self.input[ids[a]].append(ids[b])
+            if a != "start":
+                self.input[ids[b]].append(ids[a])
 
     def solve_part_one(self) -> int:
         """Solve part one of the puzzle.
@@ -53,7 +64,7 @@ class Solver(SolverInterface):
         return self._solve(allow_second_visit=True)
 
     def _solve(self, allow_second_visit: bool) -> int:
-        """Solve the puzzle.
+        """Solve the puzzle, counting routes with a memoised depth first search.
 
         Args:
             allow_second_visit (bool): visit one lowercase node twice
@@ -61,35 +72,19 @@ class Solver(SolverInterface):
         Returns:
             int: number of routes discovered
         """
-        found = 0
-        queue: deque[list[str]] = deque([["start"]])
-
-        while queue:
-            path = queue.popleft()
-
-            counter = Counter(path)
-
-            moves = [
-                x
-                for x in self.input[path[-1]]
-                if x != "start"
-                and (
-                    x.isupper()
-                    or x not in counter
-                    or (
-                        allow_second_visit
-                        and all(v == 1 for k, v in counter.items() if k.islower())
-                    )
-                )
-            ]
-
-            for x in moves:
-                if x == "end":
-                    found += 1
-                else:
-                    queue.append([*path, x])
-
-        return found
+
+        @cache
+        def count(cave: int, visited: int, second_visit: bool) -> int:
+            if cave == 1:
+                return 1
+            visited |= self.small_caves[cave]
+            return sum(
+                count(x, visited, second_visit and not visited & self.small_caves[x])
+                for x in self.input[cave]
+                if second_visit or not visited & self.small_caves[x]
+            )
+
+        return count(0, 0, allow_second_visit)
 
 
 if __name__ == "__main__":  # pragma: no cover
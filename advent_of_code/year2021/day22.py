@@ -11,6 +11,7 @@ from sys import path
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
+from advent_of_code.utils.cuboids import Box, count_switched_on
 from advent_of_code.utils.parser import parse_lines, str_tuple_processor
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
@@ -29,17 +30,9 @@ class Solver(SolverInterface):
         Args:
             puzzle_input (list[str]): The lines of the input file
         """
-        self.input: list[tuple[int, ...]] = [
-            (
-                1 if toggle == "on" else -1,
-                int(min_x),
-                int(max_x),
-                int(min_y),
-                int(max_y),
-                int(min_z),
-                int(max_z),
-            )
-            for toggle, min_x, max_x, min_y, max_y, min_z, max_z in parse_lines(
+        self.input: list[tuple[bool, Box]] = [
+            (toggle == "on", tuple(int(x) for x in cuboid))
+            for toggle, *cuboid in parse_lines(
                 puzzle_input,
                 (
                     r"(on|off) "
@@ -80,33 +73,14 @@ class Solver(SolverInterface):
         steps = (
             self.input
             if full_reboot
-            else [cube for cube in self.input if all(-50 <= x <= 50 for x in cube)]
+            else [
+                (switch_on, cuboid)
+                for switch_on, cuboid in self.input
+                if all(-50 <= x <= 50 for x in cuboid)
+            ]
         )
 
-        # repeatedly add the steps to the reactor, everytime checking for any
-        # intersections to add or remove
-        reactor: list[tuple[int, ...]] = []
-        for step in steps:
-            updates = [step] if step[0] == 1 else []
-            for cuboid in reactor:
-                cube = (
-                    -1 if cuboid[0] == 1 else 1,  # remove interesction for additions
-                    step[1] if step[1] > cuboid[1] else cuboid[1],  # max
-                    step[2] if step[2] < cuboid[2] else cuboid[2],  # min
-                    step[3] if step[3] > cuboid[3] else cuboid[3],  # max
-                    step[4] if step[4] < cuboid[4] else cuboid[4],  # min
-                    step[5] if step[5] > cuboid[5] else cuboid[5],  # max
-                    step[6] if step[6] < cuboid[6] else cuboid[6],  # min
-                )
-                if cube[1] <= cube[2] and cube[3] <= cube[4] and cube[5] <= cube[6]:
-                    updates.append(cube)
-            reactor.extend(updates)
-
-        # sum the cuboids in the reactor
-        return sum(
-            magnitude * (max_x - min_x + 1) * (max_y - min_y + 1) * (max_z - min_z + 1)
-            for magnitude, min_x, max_x, min_y, max_y, min_z, max_z in reactor
-        )
+        return count_switched_on(steps)
 
 
 if __name__ == "__main__":  # pragma: no cover
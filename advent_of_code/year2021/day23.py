@@ -5,8 +5,7 @@ Amphipod
 For puzzle specification and desciption, visit
 https://adventofcode.com/2021/day/23
 """
-from collections.abc import Iterator
-from heapq import heapify, heappop, heappush
+from heapq import heappop, heappush
 from pathlib import Path
 from sys import path
 
@@ -17,7 +16,31 @@ from advent_of_code.utils.parser import parse_grid, str_processor
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
-State = tuple[str, ...]
+# The state is packed into a str, with the eleven hallway spaces followed by
+# each room in turn, listed from the top down
+HALLWAY = 11
+AMPHIPODS = "ABCD"
+DOORS = (2, 4, 6, 8)
+STOPS = (0, 1, 3, 5, 7, 9, 10)
+MOVE_COSTS = (1, 10, 100, 1000)
+
+# the minimum number of hallway moves from each room to each room, stepping aside
+# and back again to leave and re-enter the same room
+ACROSS = [[max(abs(a - b), 2) for b in DOORS] for a in DOORS]
+
+# bitmasks of the hallway spaces crossed moving from each door to each stop,
+# including the stop itself, and between each pair of doors
+STOP_PATHS = [
+    {
+        stop: sum(1 << i for i in range(min(door, stop), max(door, stop) + 1))
+        & ~(1 << door)
+        for stop in STOPS
+    }
+    for door in DOORS
+]
+DOOR_PATHS = [
+    [sum(1 << i for i in range(min(a, b), max(a, b) + 1)) for b in DOORS] for a in DOORS
+]
 
 
 class Solver(SolverInterface):
@@ -39,9 +62,6 @@ class Solver(SolverInterface):
             r"[#. ABCD]",
             str_processor,
         )
-        self.room_map = {"A": 2, "B": 4, "C": 6, "D": 8}
-        self.room_indices = set(self.room_map.values())
-        self.move_costs = {"A": 1, "B": 10, "C": 100, "D": 1000}
 
     def solve_part_one(self) -> int:
         """Solve part one of the puzzle.
@@ -59,194 +79,195 @@ class Solver(SolverInterface):
         """
         return self._solve(self.input_part_two)
 
-    def amphipods_can_leave(self, state: State, room: str) -> bool:
-        """Determine if any amphipod can leave the room.
+    def _moves_home(
+        self, state: str, rooms: list[str], occupied: int
+    ) -> list[tuple[str, int, int]]:
+        """Find a move taking an amphipod into its room.
+
+        Moving an amphipod home is always part of a best solution, so there is no
+        need to explore any other moves when one is available. The lower bound
+        falls by exactly the cost of the move.
 
         Args:
-            state (State): the state
-            room (str): the room to check
+            state (str): the state
+            rooms (list[str]): the contents of each room
+            occupied (int): bitmask of the occupied hallway spaces
 
         Returns:
-            bool: True if any can leave, else false
+            list[tuple[str, int, int]]: the next state, the cost and the change in
+                the lower bound, if a move is possible
         """
-        return any(x != room for x in state[self.room_map[room]])
+        depth = len(rooms[0])
+        settled = [set(room) <= {".", AMPHIPODS[i]} for i, room in enumerate(rooms)]
+
+        # from the hallway
+        for stop in STOPS:
+            if (item := state[stop]) != ".":
+                dest = AMPHIPODS.index(item)
+                if (
+                    settled[dest]
+                    and not (occupied ^ (1 << stop)) & STOP_PATHS[dest][stop]
+                ):
+                    down = rooms[dest].count(".")
+                    next_state = list(state)
+                    next_state[stop] = "."
+                    next_state[HALLWAY + dest * depth + down - 1] = item
+                    cost = (abs(DOORS[dest] - stop) + down) * MOVE_COSTS[dest]
+                    return [("".join(next_state), cost, -cost)]
+
+        # straight from another room
+        for src, room in enumerate(rooms):
+            if not settled[src]:
+                up = room.count(".") + 1
+                dest = AMPHIPODS.index(room[up - 1])
+                if settled[dest] and not occupied & DOOR_PATHS[src][dest]:
+                    down = rooms[dest].count(".")
+                    next_state = list(state)
+                    next_state[HALLWAY + src * depth + up - 1] = "."
+                    next_state[HALLWAY + dest * depth + down - 1] = room[up - 1]
+                    cost = (up + ACROSS[src][dest] + down) * MOVE_COSTS[dest]
+                    return [("".join(next_state), cost, -cost)]
+
+        return []
 
-    def amphipods_can_enter(self, state: State, room: str) -> bool:
-        """Determine if any amphipod can enter the room.
+    def _moves_out(
+        self, state: str, rooms: list[str], occupied: int
+    ) -> list[tuple[str, int, int]]:
+        """Find all the moves of amphipods out of rooms and into the hallway.
 
         Args:
-            state (State): the state
-            room (str): the room to check
+            state (str): the state
+            rooms (list[str]): the contents of each room
+            occupied (int): bitmask of the occupied hallway spaces
 
         Returns:
-            bool: True if any can enter, else false
+            list[tuple[str, int, int]]: the next states, the costs and the changes
+                in the lower bound
         """
-        return all(x == room for x in state[self.room_map[room]])
+        depth = len(rooms[0])
+        result = []
+        for src, room in enumerate(rooms):
+            if not set(room) <= {".", AMPHIPODS[src]}:
+                up = room.count(".") + 1
+                item = room[up - 1]
+                dest = AMPHIPODS.index(item)
+                for stop, route in STOP_PATHS[src].items():
+                    if not occupied & route and not self._deadlocked(state, stop, dest):
+                        next_state = list(state)
+                        next_state[stop] = item
+                        next_state[HALLWAY + src * depth + up - 1] = "."
+                        result.append(
+                            (
+                                "".join(next_state),
+                                (up + abs(DOORS[src] - stop)) * MOVE_COSTS[dest],
+                                (abs(DOORS[dest] - stop) - up - ACROSS[src][dest])
+                                * MOVE_COSTS[dest],
+                            )
+                        )
+        return result
 
-    def route_is_clear(self, state: State, a: int, b: int) -> bool:
-        """Determine if the route betwen a and b is clear to travel.
+    def _deadlocked(self, state: str, stop: int, dest: int) -> bool:
+        """Check if stopping in the hallway would block another amphipod forever.
 
         Args:
-            state (State): the state
-            a (int): point a
-            b (int): point b
+            state (str): the state
+            stop (int): the hallway space to stop in
+            dest (int): the destination room of the amphipod
 
         Returns:
-            bool: True is route a to b is clear to travel, otherwise False
+            bool: True if the amphipod and another would block each other's routes
         """
-        return all(
-            state[i] == "."
-            for i in range(min(a, b) + 1, max(a, b))
-            if i not in self.room_indices
+        between = STOP_PATHS[dest][stop] ^ (1 << stop)
+        return any(
+            between & (1 << other)
+            and (item := state[other]) != "."
+            and STOP_PATHS[AMPHIPODS.index(item)][other] & (1 << stop)
+            for other in STOPS
         )
 
-    def reachable_in_coridoor(self, state: State, start: int) -> Iterator[int]:
-        """Iterate all the reachable spaces in the coridoor.
+    def _lower_bound(self, state: str, depth: int) -> int:
+        """Find the cost of moving every amphipod home, ignoring any blocking.
 
         Args:
-            state (State): the state
-            start (int): the starting index
+            state (str): the state, with an empty hallway
+            depth (int): the depth of each room
 
-        Yields:
-            int: Iterator of reachable spaces
+        Returns:
+            int: the lower bound of the remaining cost
         """
-        for i in range(start, -1, -1):
-            if i not in self.room_indices:
-                if state[i] == ".":
-                    yield i
-                else:
-                    break
-        for i in range(start, len(state)):
-            if i not in self.room_indices:
-                if state[i] == ".":
-                    yield i
-                else:
-                    break
-
-    def _room_to_room(self, state: State) -> list[tuple[State, int]]:
-        # If we can move an item straight from one room to another,
-        # this is the best possible next move
-        result = []
-        for src_room, src_index in self.room_map.items():
-            if self.amphipods_can_leave(state, src_room):
-                item = state[src_index][0]
-                dest_index = self.room_map[item]
-                if self.amphipods_can_enter(state, item) and self.route_is_clear(
-                    state, src_index, dest_index
-                ):
-                    # item able to leave and to enter it's destination
-                    # and move to another room.
-                    cost = (
-                        (self.room_size - len(state[src_index]) + 1)  # up
-                        + abs(dest_index - src_index)  # across
-                        + (self.room_size - len(state[dest_index]))  # down
-                    ) * self.move_costs[item]
-                    next_state = list(state)
-                    next_state[src_index] = state[src_index][1:]
-                    next_state[dest_index] = item + state[dest_index]
-                    result.append((tuple(next_state), cost))
-        return result
-
-    def _coridoor_to_room(self, state: State) -> list[tuple[State, int]]:
-        # If we can move an from the coridoor into a room, then this
-        # is the second best possible next move.
-        result = []
-        for src_index, item in enumerate(state):
-            if src_index not in self.room_indices and item in "ABCD":
-                dest_index = self.room_map[item]
-                if self.amphipods_can_enter(state, item) and self.route_is_clear(
-                    state, src_index, dest_index
-                ):
-                    # move the item from the coridoor into the room
-                    cost = (
-                        abs(dest_index - src_index)  # across
-                        + (self.room_size - len(state[dest_index]))  # down
-                    ) * self.move_costs[item]
-                    next_state = list(state)
-                    next_state[src_index] = "."
-                    next_state[dest_index] = item + state[dest_index]
-                    result.append((tuple(next_state), cost))
-        return result
-
-    def _other_moves(self, state: State) -> list[tuple[State, int]]:
-        # If no other better move, yield the possible moves of items into
-        # each different positions in the coridoor
-        result = []
-        for src_room, src_index in self.room_map.items():
-            if self.amphipods_can_leave(state, src_room):
-                item = state[src_index][0]
-                for dest_index in self.reachable_in_coridoor(state, src_index):
-                    cost = (
-                        (self.room_size - len(state[src_index]) + 1)  # up
-                        + abs(dest_index - src_index)  # across
-                    ) * self.move_costs[item]
-                    next_state = list(state)
-                    next_state[src_index] = state[src_index][1:]
-                    next_state[dest_index] = item
-                    result.append((tuple(next_state), cost))
+        bound = 0
+        entering = [0, 0, 0, 0]
+
+        for src in range(len(DOORS)):
+            # amphipods must leave, unless already home with only the same below
+            room = state[HALLWAY + src * depth : HALLWAY + (src + 1) * depth]
+            for up, item in enumerate(room.rstrip(AMPHIPODS[src]), start=1):
+                if item != ".":
+                    dest = AMPHIPODS.index(item)
+                    bound += (up + ACROSS[src][dest]) * MOVE_COSTS[dest]
+                    entering[dest] += 1
+
+        # the amphipods entering each room will fill the top spaces
+        return bound + sum(
+            MOVE_COSTS[i] * count * (count + 1) // 2 for i, count in enumerate(entering)
+        )
 
-        return result
+    def _solve(self, input_grid: dict[tuple[int, int], str]) -> int:
+        """Solve the puzzle, using the A* search algorithm.
 
-    def _next_state(self, state: State) -> list[tuple[State, int]]:
-        """Iterate over possible next spaces.
+        The lower bound is only calculated in full for the initial state, and then
+        updated as each amphipod moves.
 
         Args:
-            state (State): the initial state
+            input_grid (dict[tuple[int, int], str]): the burrow
 
         Returns:
-            list[tuple[State, int]]: Iterator of states
+            int: the lowest cost to organise the amphipods
         """
-        if result := self._room_to_room(state):
-            return result
-
-        if result := self._coridoor_to_room(state):
-            return result
-
-        return self._other_moves(state)
-
-    def _solve(self, input_grid: dict[tuple[int, int], str]) -> int:
         # create the inital state
         max_y = max(y for _, y in input_grid)
-        state: State = (
-            ".",
-            ".",
-            "".join([input_grid[(3, y)] for y in range(2, max_y)]),
-            ".",
-            "".join([input_grid[(5, y)] for y in range(2, max_y)]),
-            ".",
-            "".join([input_grid[(7, y)] for y in range(2, max_y)]),
-            ".",
-            "".join([input_grid[(9, y)] for y in range(2, max_y)]),
-            ".",
-            ".",
+        depth = max_y - 2
+        state = "".join(
+            [
+                "." * HALLWAY,
+                *(input_grid[(door + 1, y)] for door in DOORS for y in range(2, max_y)),
+            ]
         )
-        self.room_size = len(state[2])
+        target = "." * HALLWAY + "".join(x * depth for x in AMPHIPODS)
 
-        # run Dykstra's algorithm until we reach the final state
-        queue: list[tuple[int, State]] = [(0, state)]
-        heapify(queue)
-        costs: dict[State, int] = {state: 0}
-        result = -1
+        # search until we reach the final state
+        queue = [(self._lower_bound(state, depth), 0, state)]
+        costs = {state: 0}
 
+        result = -1
         while queue:
-            cost, state = heappop(queue)
-            if cost > costs[state]:
-                continue
-
-            # check for final state - all rooms full and items have moved
-            if (
-                all(len(state[i]) == self.room_size for i in self.room_indices)
-                and cost > 0
-            ):
+            estimate, cost, state = heappop(queue)
+            if state == target:
                 result = cost
                 break
+            if cost > costs[state]:
+                continue
 
-            # explore the next state
-            for next_state, additional_cost in self._next_state(state):
+            # explore the next states
+            rooms = [
+                state[HALLWAY + i * depth : HALLWAY + (i + 1) * depth]
+                for i in range(len(DOORS))
+            ]
+            occupied = sum(1 << stop for stop in STOPS if state[stop] != ".")
+            for next_state, additional_cost, bound_change in self._moves_home(
+                state, rooms, occupied
+            ) or self._moves_out(state, rooms, occupied):
                 tentative_cost = cost + additional_cost
                 if next_state not in costs or tentative_cost < costs[next_state]:
                     costs[next_state] = tentative_cost
-                    heappush(queue, (tentative_cost, next_state))
+                    heappush(
+                        queue,
+                        (
+                            estimate + additional_cost + bound_change,
+                            tentative_cost,
+                            next_state,
+                        ),
+                    )
 
         return result
 
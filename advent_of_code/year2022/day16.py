@@ -5,9 +5,9 @@ Proboscidea Volcanium
 For puzzle specification and desciption, visit
 https://adventofcode.com/2022/day/16
 """
-from operator import itemgetter
+from collections import deque
 from pathlib import Path
-from sys import maxsize, path
+from sys import path
 
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
@@ -52,8 +52,7 @@ class Solver(SolverInterface):
             self._get_ready_to_solve()
 
         # find the route with the highest flow rates
-        self.paths.clear()
-        return self._find_routes("AA", ["AA"], 0, 30)
+        return max(self._best_scores(30))
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
@@ -64,45 +63,37 @@ class Solver(SolverInterface):
         if not self.ready_to_solve:
             self._get_ready_to_solve()
 
-        self.paths.clear()
-        self._find_routes("AA", ["AA"], 0, 26)
-        del self.paths[("AA",)]
+        best = self._best_scores(26)
 
-        # iterate over routes, keeping the max score for each set of values
-        valve_sets: dict[frozenset[str], int] = {}
-        for route, score in self.paths.items():
-            frozen = frozenset(route[1:])
-            valve_sets[frozen] = max(valve_sets.get(frozen, 0), score)
+        # transform to the best score for any subset of each set of valves
+        for i in range(len(self.flows)):
+            bit = 1 << i
+            for mask in range(len(best)):
+                if mask & bit and best[mask ^ bit] > best[mask]:
+                    best[mask] = best[mask ^ bit]
 
         # find the max score for two disjoint sets of values
-        return max(
-            human_score + elephant_score
-            for human, human_score in valve_sets.items()
-            for elephant, elephant_score in valve_sets.items()
-            if human.isdisjoint(elephant)
-        )
+        everything = len(best) - 1
+        return max(score + best[everything ^ mask] for mask, score in enumerate(best))
 
     def _get_ready_to_solve(self) -> None:
         """Prepare to solve."""
-        # find all the useful nodes (ie positive flow rates)
-        self.nodes = {"AA"} | {node for node, rate in self.rates.items() if rate > 0}
+        # index the useful nodes (ie positive flow rates), followed by the start
+        nodes = sorted(node for node, rate in self.rates.items() if rate > 0)
+        self.flows = [self.rates[node] for node in nodes]
+        if "AA" not in nodes:
+            nodes.append("AA")
+        self.start = nodes.index("AA")
 
         # find distances betwen the useful nodes
-        self.distances = {
-            node: {
-                dest: dist
-                for dest, dist in self._dykstra_single_source_all_distances(
-                    node
-                ).items()
-                if dest in self.nodes and dist
-            }
-            for node in self.nodes
-        }
-
-        self.paths: dict[tuple[str, ...], int] = {}
-
-    def _dykstra_single_source_all_distances(self, initial: str) -> dict[str, int]:
-        """Use Dykstra's Algorithm to find distances between source and all other nodes.
+        self.distances = [
+            [distances[dest] for dest in nodes[: len(self.flows)]]
+            for distances in (self._breadth_first_distances(node) for node in nodes)
+        ]
+        self.ready_to_solve = True
+
+    def _breadth_first_distances(self, initial: str) -> dict[str, int]:
+        """Use a breadth first search to find distances from the source to all nodes.
 
         Args:
             initial (str): the starting node
@@ -110,75 +101,45 @@ class Solver(SolverInterface):
         Returns:
             dict[str, int]: dictionary of distances between nodes
         """
-        routes = {
-            start: {finish: 1 for finish in paths}
-            for start, paths in self.routes.items()
-        }
-
-        distances = {node: maxsize for node in self.routes}
-        distances[initial] = 0
-        previous: dict[str, str] = {}
-        visited: set[str] = set()
-
-        while len(visited) < len(distances):
-            current, dist = min(
-                ((n, d) for n, d in distances.items() if n not in visited),
-                key=itemgetter(1),
-            )
-            for neighbour, distance_to_neighbour in routes[current].items():
-                tentative_distance = dist + distance_to_neighbour
-                if (
-                    neighbour not in visited
-                    and tentative_distance < distances[neighbour]
-                ):
-                    distances[neighbour] = tentative_distance
-                    previous[neighbour] = current
-            visited.add(current)
-
+        distances = {initial: 0}
+        queue = deque([initial])
+        while queue:
+            current = queue.popleft()
+            for neighbour in self.routes[current]:
+                if neighbour not in distances:
+                    distances[neighbour] = distances[current] + 1
+                    queue.append(neighbour)
         return distances
 
-    def _find_routes(
-        self, current: str, route: list[str], score: int, time: int
-    ) -> int:
-        """Recursively find all the routes between each valve.
+    def _best_scores(self, time: int) -> list[int]:
+        """Find the best score for each set of opened valves.
 
         Args:
-            current (str): the current valve
-            route (list[str]): the route so far
-            score (int): the current score
-            time (int): the time remaining
+            time (int): the time available
 
         Returns:
-            int: the best result from this branch
+            list[int]: the best score, indexed by the bitmask of opened valves
         """
-        # turn on the value, and update the score
-        if self.rates[current]:
-            time -= 1
-            score += self.rates[current] * time
-
-        # record the paths (needed for part two)
-        self.paths[tuple(route)] = score
-
-        # calulate the next steps
-        next_steps = [
-            node
-            for node, dist in self.distances[current].items()
-            if (time - dist - 1) > 0 and node not in route
-        ]
-
-        # explore the next steps, if possible
-        if next_steps:
-            return max(
-                self._find_routes(
-                    next_step,
-                    [*route, next_step],
-                    score,
-                    time - self.distances[current][next_step],
-                )
-                for next_step in next_steps
-            )
-        self.paths[tuple(route)] = score
-        return score
+        flows = self.flows
+        distances = self.distances
+        best = [0] * (1 << len(flows))
+        seen: dict[tuple[int, int, int], int] = {}
+
+        def search(current: int, opened: int, time: int, score: int) -> None:
+            # drop states reached before with at least as good a score
+            key = (current, opened, time)
+            if seen.get(key, -1) >= score:
+                return
+            seen[key] = score
+
+            best[opened] = max(best[opened], score)
+            for i, distance in enumerate(distances[current]):
+                bit = 1 << i
+                if not opened & bit and (remaining := time - distance - 1) > 0:
+                    search(i, opened | bit, remaining, score + flows[i] * remaining)
+
+        search(self.start, 0, time, 0)
+        return best
 
 
 if __name__ == "__main__":  # pragma: no cover
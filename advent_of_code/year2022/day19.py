@@ -6,7 +6,7 @@ For puzzle specification and desciption, visit
 https://adventofcode.com/2022/day/19
 """
 from dataclasses import dataclass
-from math import ceil, prod
+from math import prod
 from pathlib import Path
 from sys import maxsize, path
 
@@ -81,11 +81,7 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        results = [
-            self._solve(b, (0, 0, 0, 0), (1, 0, 0, 0), 24, {}) for b in self.input
-        ]
-
-        return sum(b.identifier * result for b, result in zip(self.input, results))
+        return sum(b.identifier * self._solve(b, 24) for b in self.input)
 
     def solve_part_two(self) -> int:
         """Solve part two of the puzzle.
@@ -93,80 +89,129 @@ class Solver(SolverInterface):
         Returns:
             int: the answer
         """
-        results = [
-            self._solve(b, (0, 0, 0, 0), (1, 0, 0, 0), 32, {}) for b in self.input[:3]
-        ]
+        return prod(self._solve(b, 32) for b in self.input[:3])
 
-        return int(prod(results))
+    def _solve(self, blueprint: _Blueprint, time: int) -> int:
+        """Branch and bound search, focusing on the next robot to build.
 
-    def _solve(
-        self,
-        blueprint: _Blueprint,
-        materials: tuple[int, ...],
-        robots: tuple[int, ...],
-        time: int,
-        best: dict[int, int],
-    ) -> int:
-        """Recusively solve the puzzle, focusing on the next robot to build.
+        Geodes are credited in full as soon as a geode robot is built, so the
+        geode robot count never needs to be part of the search state.
 
         Args:
             blueprint (_Blueprint): the blueprint to solve
-            materials (tuple[int, ...]): the current materials
-            robots (tuple[int, ...]): the current robots
-            time (int): the remaining time
-            best (dict[int, int]): mapping of seconds remaining to best geode produced
+            time (int): the time available
 
         Returns:
             int: the best result (highest number of geodes)
         """
-        # abandon path if behind best path
-        if materials[GEODE] < best.get(time + 1, 0):
-            return 0
-
-        # record the best path results for far
-        if materials[GEODE] > 0:
-            best[time] = max(best.get(time, 0), materials[GEODE])
-
-        # initialise results with the result of not building any more robots
-        results = [materials[GEODE] + (robots[GEODE] * time)]
-
-        # build robots, if possible
-        for robot_to_build in [ORE, CLAY, OBSIDIAN, GEODE]:
-            if robots[robot_to_build] < blueprint.max_materials[robot_to_build]:
-                # calculate time to get mine enough material to build robot,
-                # using maxsize as infinity
-                delta = max(
-                    max(0, ceil((b - m) / r)) if r > 0 else maxsize
-                    for r, m, b in zip(
-                        robots, materials, blueprint.robots[robot_to_build]
-                    )
-                    if b > 0
+        ore_cost = blueprint.robots[ORE][ORE]
+        clay_cost = blueprint.robots[CLAY][ORE]
+        obsidian_ore_cost, obsidian_clay_cost = blueprint.robots[OBSIDIAN][:2]
+        geode_ore_cost, _, geode_obsidian_cost, _ = blueprint.robots[GEODE]
+        max_ore, max_clay, max_obsidian, _ = blueprint.max_materials
+
+        best = 0
+        seen: dict[tuple[int, ...], int] = {}
+
+        def search(
+            time: int,
+            ore: int,
+            clay: int,
+            obsidian: int,
+            ore_robots: int,
+            clay_robots: int,
+            obsidian_robots: int,
+            geodes: int,
+        ) -> None:
+            nonlocal best
+            best = max(best, geodes)
+
+            # discard materials that could never be spent in the time remaining
+            ore = min(ore, max_ore * time - ore_robots * (time - 1))
+            clay = min(clay, max_clay * time - clay_robots * (time - 1))
+            obsidian = min(obsidian, max_obsidian * time - obsidian_robots * (time - 1))
+
+            # abandon the path if an optimistic upper bound, building a geode robot
+            # every remaining minute, cannot beat the best, or if the transposition
+            # table has already seen this state with at least as many geodes
+            key = (time, ore, clay, obsidian, ore_robots, clay_robots, obsidian_robots)
+            if geodes + (time * (time - 1)) // 2 <= best or seen.get(key, -1) >= geodes:
+                return
+            seen[key] = geodes
+
+            # build a geode robot, using maxsize as infinity while unable to
+            wait = max(
+                0,
+                -((ore - geode_ore_cost) // ore_robots),
+                -((obsidian - geode_obsidian_cost) // obsidian_robots)
+                if obsidian_robots > 0
+                else maxsize,
+            )
+            if (remaining := time - wait - 1) > 0:
+                search(
+                    remaining,
+                    ore + ore_robots * (wait + 1) - geode_ore_cost,
+                    clay + clay_robots * (wait + 1),
+                    obsidian + obsidian_robots * (wait + 1) - geode_obsidian_cost,
+                    ore_robots,
+                    clay_robots,
+                    obsidian_robots,
+                    geodes + remaining,
                 )
 
-                # if we have enough time to build and use the robot before time is up,
-                # then build the robot
-                if time - delta > 1:
-                    results.append(
-                        self._solve(
-                            blueprint,
-                            tuple(
-                                m + (r * (delta + 1)) - b
-                                for m, r, b in zip(
-                                    materials,
-                                    robots,
-                                    blueprint.robots[robot_to_build],
-                                )
-                            ),
-                            tuple(
-                                r + (1 if i == robot_to_build else 0)
-                                for i, r in enumerate(robots)
-                            ),
-                            time - delta - 1,
-                            best,
-                        )
+            # build an obsidian robot, if more obsidian could ever be spent
+            if obsidian_robots < max_obsidian:
+                wait = max(
+                    0,
+                    -((ore - obsidian_ore_cost) // ore_robots),
+                    -((clay - obsidian_clay_cost) // clay_robots)
+                    if clay_robots > 0
+                    else maxsize,
+                )
+                if (remaining := time - wait - 1) > 1:
+                    search(
+                        remaining,
+                        ore + ore_robots * (wait + 1) - obsidian_ore_cost,
+                        clay + clay_robots * (wait + 1) - obsidian_clay_cost,
+                        obsidian + obsidian_robots * (wait + 1),
+                        ore_robots,
+                        clay_robots,
+                        obsidian_robots + 1,
+                        geodes,
+                    )
+
+            # build a clay robot, if more clay could ever be spent
+            if clay_robots < max_clay:
+                wait = max(0, -((ore - clay_cost) // ore_robots))
+                if (remaining := time - wait - 1) > 2:
+                    search(
+                        remaining,
+                        ore + ore_robots * (wait + 1) - clay_cost,
+                        clay + clay_robots * (wait + 1),
+                        obsidian + obsidian_robots * (wait + 1),
+                        ore_robots,
+                        clay_robots + 1,
+                        obsidian_robots,
+                        geodes,
+                    )
+
+            # build an ore robot, if more ore could ever be spent
+            if ore_robots < max_ore:
+                wait = max(0, -((ore - ore_cost) // ore_robots))
+                if (remaining := time - wait - 1) > 1:
+                    search(
+                        remaining,
+                        ore + ore_robots * (wait + 1) - ore_cost,
+                        clay + clay_robots * (wait + 1),
+                        obsidian + obsidian_robots * (wait + 1),
+                        ore_robots + 1,
+                        clay_robots,
+                        obsidian_robots,
+                        geodes,
                     )
 
-        return max(results)
+        search(time, 0, 0, 0, 1, 0, 0, 0)
+        return best
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,13 +5,13 @@ Grove Positioning System
 For puzzle specification and desciption, visit
 https://adventofcode.com/2022/day/20
 """
-from collections import deque
 from pathlib import Path
 from sys import path
 
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
+from advent_of_code.utils.block_list import BlockList
 from advent_of_code.utils.parser import int_processor, parse_lines
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
@@ -60,14 +60,11 @@ class Solver(SolverInterface):
         """
         values = [x * multiplier for x in self.input]
 
-        # seq in the index number of the values in the input
-        seq = deque(range(len(self.input)))
+        # mix the index numbers of the values in the input
+        seq = BlockList(len(values))
         for _ in range(cycles):
             for i, x in enumerate(values):
-                seq.rotate(-seq.index(i))
-                seq.popleft()
-                seq.rotate(-x)
-                seq.appendleft(i)
+                seq.move(i, x)
 
         mixed = [values[i] for i in seq]
         index = mixed.index(0)
@@ -5,11 +5,11 @@ Unstable Diffusion
 For puzzle specification and desciption, visit
 https://adventofcode.com/2022/day/23
 """
-from collections import Counter, deque
-from collections.abc import Callable
 from pathlib import Path
 from sys import path
 
+import numpy as np
+
 if __name__ == "__main__":  # pragma: no cover
     path.append(str(Path(__file__).parent.parent.parent))
 
@@ -17,6 +17,9 @@ from advent_of_code.utils.parser import parse_grid, str_processor
 from advent_of_code.utils.runner import runner
 from advent_of_code.utils.solver_interface import SolverInterface
 
+# the (dy, dx) of each direction, with opposite directions paired as N, S, W, E
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
 
 class Solver(SolverInterface):
     """Solves the puzzle."""
@@ -50,57 +53,77 @@ class Solver(SolverInterface):
         return self._solve(10000)[1]
 
     def _solve(self, rounds: int) -> tuple[int, int]:
-        elves = {k for k, v in self.input.items() if v == "#"}
+        """Run the diffusion, as whole array operations on a grid of elves.
 
-        take_move: dict[str, Callable[[int, int], tuple[int, int]]] = {
-            "N": lambda x, y: (x, y - 1),
-            "S": lambda x, y: (x, y + 1),
-            "W": lambda x, y: (x - 1, y),
-            "E": lambda x, y: (x + 1, y),
-        }
+        Only two elves can ever propose the same tile, and then only from opposite
+        sides of it, so collisions are found by comparing each direction's
+        proposals with those of the opposite direction, two tiles away.
+
+        Args:
+            rounds (int): the maximum number of rounds to run
 
-        order = deque(["N", "S", "W", "E"])
+        Returns:
+            tuple[int, int]: the empty tiles in the bounding box, and the first
+                round in which no elf moved
+        """
+        # place the elves in a grid, indexed by (y, x) with an empty border
+        grid = np.zeros(
+            (max(y for _, y in self.input) + 3, max(x for x, _ in self.input) + 3),
+            dtype=np.bool_,
+        )
+        for (x, y), value in self.input.items():
+            grid[y + 1, x + 1] = value == "#"
 
         last_round = -1
         for current_round in range(rounds):
-            # propose the moves
-            moves = {}
-            for x, y in elves:
-                look = {
-                    "NW": (x - 1, y - 1) in elves,
-                    "N": (x, y - 1) in elves,
-                    "NE": (x + 1, y - 1) in elves,
-                    "W": (x - 1, y) in elves,
-                    "E": (x + 1, y) in elves,
-                    "SW": (x - 1, y + 1) in elves,
-                    "S": (x, y + 1) in elves,
-                    "SE": (x + 1, y + 1) in elves,
-                }
-                if any(look.values()):
-                    for direction in order:
-                        if not any(v for k, v in look.items() if direction in k):
-                            moves[(x, y)] = take_move[direction](x, y)
-                            break
+            # keep the border empty, so shifts never wrap elves around the grid
+            if grid[[0, -1]].any() or grid[:, [0, -1]].any():
+                grid = np.pad(grid, 1)
+
+            # find the directions free of elves, and the elves with neighbours
+            neighbours = {
+                (dy, dx): np.roll(grid, (-dy, -dx), axis=(0, 1))
+                for dy in (-1, 0, 1)
+                for dx in (-1, 0, 1)
+                if dy or dx
+            }
+            free = [
+                ~(
+                    neighbours[(dy or -1, dx or -1)]
+                    | neighbours[(dy, dx)]
+                    | neighbours[(dy or 1, dx or 1)]
+                )
+                for dy, dx in DIRECTIONS
+            ]
+            undecided = grid & ~(free[0] & free[1] & free[2] & free[3])
+
+            # propose the moves, in the order for this round
+            proposals = [undecided] * len(DIRECTIONS)
+            for i in range(len(DIRECTIONS)):
+                direction = (current_round + i) % len(DIRECTIONS)
+                proposals[direction] = undecided & free[direction]
+                undecided = undecided & ~free[direction]
+
+            # move the elves, unless an elf from the opposite direction collides
+            moved = np.zeros_like(grid)
+            for direction, (dy, dx) in enumerate(DIRECTIONS):
+                moves = proposals[direction] & ~np.roll(
+                    proposals[direction ^ 1], (-2 * dy, -2 * dx), axis=(0, 1)
+                )
+                moved |= moves
+                grid = grid | np.roll(moves, (dy, dx), axis=(0, 1))
 
             # has anyone moved?
-            if not moves:
+            if not moved.any():
                 last_round = current_round
                 break
-
-            # move the elf only if no other elves want to move there
-            counter = Counter(moves.values())
-            unique_moves = {k: v for k, v in moves.items() if counter[v] == 1}
-            elves.difference_update(unique_moves.keys())
-            elves.update(unique_moves.values())
-
-            # change the starting order
-            order.rotate(-1)
+            grid &= ~moved
 
         # finished the rounds, so calculate the area bounding box, then return
-        (min_x, max_x), (min_y, max_y) = ((min(a), max(a)) for a in zip(*elves))
-        area = ((max_x - min_x + 1) * (max_y - min_y + 1)) - len(elves)
+        ys, xs = np.nonzero(grid)
+        area = (ys.max() - ys.min() + 1) * (xs.max() - xs.min() + 1) - len(ys)
 
-        return area, last_round + 1
+        return int(area), last_round + 1
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,27 @@
+"""Unit test for advent_of_code.utils.block_list."""
+from advent_of_code.utils.block_list import BlockList
+
+
+def test_block_list() -> None:
+    """Unit test for the BlockList class, against moves in a plain list."""
+    blocks = BlockList(10)
+    expected = list(range(10))
+    assert len(blocks) == 10
+    assert list(blocks) == expected
+
+    for step in range(50):
+        item, offset = step * 7 % 10, (step * 13) % 23 - 11
+        position = expected.index(item)
+        expected.pop(position)
+        expected.insert((position + offset) % 9, item)
+        blocks.move(item, offset)
+        assert list(blocks) == expected
+        assert all(blocks.index(x) == i for i, x in enumerate(expected))
+
+
+def test_block_list_single() -> None:
+    """Unit test for the BlockList class, moving its only integer."""
+    blocks = BlockList(1)
+    blocks.move(0, 5)
+    assert list(blocks) == [0]
+    assert blocks.index(0) == 0
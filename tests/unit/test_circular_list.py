@@ -0,0 +1,19 @@
+"""Unit test for advent_of_code.utils.circular_list."""
+from advent_of_code.utils.circular_list import CircularList
+
+
+def test_circular_list() -> None:
+    """Unit test for the CircularList class."""
+    circle = CircularList([3, 1, 4, 2], size=8)
+    assert list(circle.values_after(3)) == [1, 4, 2]
+    assert circle.after(3) == 1
+    assert circle.after(3, 6) == 4
+
+    circle.insert_after(4, 7)
+    assert list(circle.values_after(3)) == [1, 4, 7, 2]
+
+    assert circle.remove_after(2) == 3
+    assert list(circle.values_after(1)) == [4, 7, 2]
+
+    circle.move_after(1, 2, 2)
+    assert list(circle.values_after(1)) == [2, 4, 7]
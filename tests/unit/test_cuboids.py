@@ -0,0 +1,53 @@
+"""Unit tests for advent_of_code.utils.cuboids."""
+from itertools import product
+
+import pytest
+from advent_of_code.utils.cuboids import (
+    Box,
+    _compressed,
+    _signed_counts,
+    count_switched_on,
+)
+
+STEPS: list[tuple[bool, Box]] = [
+    (True, (0, 4, 0, 4)),
+    (True, (2, 6, 2, 6)),
+    (False, (3, 3, 0, 9)),
+    (True, (1, 2, 1, 2)),
+    (False, (5, 8, -1, 3)),
+    (True, (0, 4, 0, 4)),
+]
+
+
+def _brute_force(steps: list[tuple[bool, Box]]) -> int:
+    """Switch each cell on and off in turn.
+
+    Args:
+        steps (list[tuple[bool, Box]]): whether to switch on, and the box
+
+    Returns:
+        int: the number of cells switched on
+    """
+    cells: set[tuple[int, ...]] = set()
+    for switch_on, box in steps:
+        ranges = [range(box[i], box[i + 1] + 1) for i in range(0, len(box), 2)]
+        if switch_on:
+            cells.update(product(*ranges))
+        else:
+            cells.difference_update(product(*ranges))
+    return len(cells)
+
+
+@pytest.mark.parametrize("length", range(len(STEPS) + 1))
+def test_count_switched_on(length: int) -> None:
+    """Test both ways of counting agree with switching each cell.
+
+    Args:
+        length (int): the number of steps to take
+    """
+    steps = STEPS[:length]
+    expected = _brute_force(steps)
+    assert count_switched_on(steps) == expected
+    if steps:
+        assert _compressed(steps) == expected
+        assert _signed_counts(steps) == expected
@@ -0,0 +1,38 @@
+"""Unit tests for advent_of_code.utils.sieve."""
+import pytest
+from advent_of_code.utils import sieve
+from advent_of_code.utils.sieve import first_admissible
+
+
+@pytest.mark.parametrize(
+    "forbidden",
+    [
+        {},
+        {3: [0]},
+        {2: [0], 3: [0, 1], 5: [1, 2, 3]},
+        {4: [1, 3], 6: [0], 7: [2, 3, 4], 9: [0, 8]},
+    ],
+)
+@pytest.mark.parametrize(("sieve_limit", "window_size"), [(1 << 22, 1 << 20), (6, 4)])
+def test_first_admissible(
+    monkeypatch: pytest.MonkeyPatch,
+    forbidden: dict[int, list[int]],
+    sieve_limit: int,
+    window_size: int,
+) -> None:
+    """Test the sieve against a brute force search, with and without deferring.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): the fixture to patch the sizes
+        forbidden (dict[int, list[int]]): the forbidden residues of each modulus
+        sieve_limit (int): the largest sieve to build
+        window_size (int): the number of candidates to check at a time
+    """
+    monkeypatch.setattr(sieve, "SIEVE_LIMIT", sieve_limit)
+    monkeypatch.setattr(sieve, "WINDOW_SIZE", window_size)
+    expected = next(
+        x
+        for x in range(10000)
+        if all(x % modulus not in residues for modulus, residues in forbidden.items())
+    )
+    assert first_admissible(forbidden) == expected
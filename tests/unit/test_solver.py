@@ -214,3 +214,39 @@ def test_cli(year: int, day: int, expected: dict[str, int | str]) -> None:
             part = "two"
 
     assert part == "two" if (day < 25) else "one"
+
+
+@pytest.mark.parametrize(
+    ("module_name", "puzzle_input", "part_one", "part_two"),
+    [
+        (
+            "advent_of_code.year2015.day22",
+            ["Hit Points: 25", "Damage: 1"],
+            "279",
+            "279",
+        ),
+        (
+            "advent_of_code.year2015.day22",
+            ["Hit Points: 43", "Damage: 10"],
+            "754",
+            "794",
+        ),
+        ("advent_of_code.year2017.day22", ["#"], "5359", "2511596"),
+        ("advent_of_code.year2017.day22", [".#", "#.", ".."], "5549", "2511710"),
+        ("advent_of_code.year2022.day20", ["0"], "0", "0"),
+    ],
+)
+def test_edge_case(
+    module_name: str, puzzle_input: list[str], part_one: str, part_two: str
+) -> None:
+    """Test solutions with inputs that have caught out earlier versions.
+
+    Args:
+        module_name (str): the module for the puzzle
+        puzzle_input (list[str]): the lines of the input
+        part_one (str): the expected answer for part one
+        part_two (str): the expected answer for part two
+    """
+    solver = import_module(module_name).Solver(puzzle_input)
+    assert str(solver.solve_part_one()) == part_one
+    assert str(solver.solve_part_two()) == part_two